@@ -16,8 +16,20 @@ Features:
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import struct, time, os, threading, binascii, traceback
-from datetime import datetime
+import struct, time, os, sys, threading, binascii, traceback, mmap
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from bisect import bisect_left, bisect_right
+
+try:
+    import numpy as np  # optional: moves the record index phase of parse_logs into C
+except ImportError:
+    np = None
+
+try:
+    from numba import njit  # optional: compiles the marker scan of index_records
+except ImportError:
+    njit = None
 
 # -----------------------
 # Constants (copied / inferred from user's code)
@@ -60,17 +72,65 @@ LOGGING_TABLE = {
 }
 LOGGING_TABLE_REV = {v: k for k, v in LOGGING_TABLE.items()}
 
+# Single-byte needles for bytes.find(), built once instead of bytes([X]) per call
+_SOB = bytes([LOG_HDR_SOB])
+_EOB = bytes([LOG_HDR_EOB])
+_SDB = bytes([DATA_HDR_SDB])
+_MDB = bytes([DATA_HDR_MDB])
+_EDB = bytes([DATA_HDR_EDB])
+
+# translate() table mapping every known level byte to _LEVEL_MARK and everything
+# else to 0x00, so candidate record starts can be found with a C-level find()
+_LEVEL_MARK = b"\x01"
+_LEVEL_TRANSLATE = bytes(1 if b in LEVEL_BY_INT else 0 for b in range(256))
+# translate the buffer in windows so a mapped file isn't copied in one piece
+_SCAN_CHUNK = 1 << 20
+# same table as a boolean mask for the numpy index path
+_LEVEL_MASK_NP = np.frombuffer(_LEVEL_TRANSLATE, dtype=np.uint8).astype(bool) if np is not None else None
+# a level byte only starts a record if an SOB follows within this many bytes
+_SOB_WINDOW = 128
+
+# UTC ISO-8601 layout for decoded timestamps (same text as datetime.isoformat() + "Z")
+_ISO_UTC = "%Y-%m-%dT%H:%M:%SZ"
+
+# precompiled timestamp unpackers; unpack_from reads the prefix without slicing bts
+_U_D = struct.Struct(">d")
+_U_Q = struct.Struct(">Q")
+_U_I = struct.Struct(">I")
+
 # Default filenames
 DEFAULT_LOG_FILE = "log.bin"
 DEFAULT_DATA_FILE = "data.bin"
 
+# Log rows are inserted into the tree in pages of this size; the next page is
+# appended when the view is scrolled near the end of what's already inserted.
+TREE_PAGE_SIZE = 500
+
+# The raw hex view renders this many bytes of the selected record at a time; more
+# is appended when it is scrolled near the end of what's shown.
+HEX_CHUNK = 4096
+
+# How often (ms) the Tk loop checks whether a background parse has finished
+PARSE_POLL_MS = 50
+
+# Leading bytes compared to tell an appended-to log from a replaced/rotated one
+LOG_HEAD_CHECK = 64
+
+# Log files are read and parsed in windows of this many bytes instead of all at once
+LOG_STREAM_CHUNK = 16 << 20
+# records ending this close to the end of a window are parsed again with the next one
+# (parsing a record looks at most _SOB_WINDOW + 4 bytes past its end)
+_STREAM_OVERLAP = 512
+
 # -----------------------
 # Utility / parsing helpers
 # -----------------------
 
+@lru_cache(maxsize=1 << 15)
 def human_time_from_timestamp_bytes(bts):
     """
     Try various ways to interpret bts as a timestamp and return a (human, rawvalue, used_fmt) tuple.
+    Cached on the (hashable) bytes: consecutive records usually share the same second.
     Heuristics:
       - if len >=8 try big-endian double (>d)
       - if len >=8 try big-endian unsigned long long (>Q)
@@ -90,25 +150,25 @@ def human_time_from_timestamp_bytes(bts):
     # try double
     if len(bts) >= 8:
         try:
-            d = struct.unpack(">d", bts[:8])[0]
+            d = _U_D.unpack_from(bts)[0]
             if plausible(d):
-                return (datetime.utcfromtimestamp(int(d)).isoformat() + "Z", d, "double>8")
+                return (time.strftime(_ISO_UTC, time.gmtime(int(d))), d, "double>8")
         except Exception:
             pass
     # try 8-byte uint
     if len(bts) >= 8:
         try:
-            q = struct.unpack(">Q", bts[:8])[0]
+            q = _U_Q.unpack_from(bts)[0]
             if plausible(q):
-                return (datetime.utcfromtimestamp(q).isoformat() + "Z", q, "uint64>8")
+                return (time.strftime(_ISO_UTC, time.gmtime(q)), q, "uint64>8")
         except Exception:
             pass
     # try 4-byte uint
     if len(bts) >= 4:
         try:
-            i = struct.unpack(">I", bts[:4])[0]
+            i = _U_I.unpack_from(bts)[0]
             if plausible(i):
-                return (datetime.utcfromtimestamp(i).isoformat() + "Z", i, "uint32>4")
+                return (time.strftime(_ISO_UTC, time.gmtime(i)), i, "uint32>4")
         except Exception:
             pass
     # ascii decode
@@ -118,7 +178,7 @@ def human_time_from_timestamp_bytes(bts):
         if s_digits:
             v = int(s_digits)
             if plausible(v):
-                return (datetime.utcfromtimestamp(v).isoformat() + "Z", v, "ascii-digits")
+                return (time.strftime(_ISO_UTC, time.gmtime(v)), v, "ascii-digits")
     except Exception:
         pass
 
@@ -126,12 +186,161 @@ def human_time_from_timestamp_bytes(bts):
     try:
         as_int = int.from_bytes(bts, "big")
         if plausible(as_int):
-            return (datetime.utcfromtimestamp(as_int).isoformat() + "Z", as_int, f"int({len(bts)})")
+            return (time.strftime(_ISO_UTC, time.gmtime(as_int)), as_int, f"int({len(bts)})")
     except Exception:
         pass
 
     return (f"<raw:{binascii.hexlify(bts).decode()}>", None, "unknown")
 
+def map_file(path):
+    """
+    Memory-map a file read-only so the parsers can work on the page cache directly
+    instead of a full f.read() copy. Returns b"" for empty files (mmap can't map 0 bytes).
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    # the mapping stays valid after the file object is closed
+    if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+        mm.madvise(mmap.MADV_SEQUENTIAL)
+    return mm
+
+def close_map(mm):
+    if isinstance(mm, mmap.mmap) and not mm.closed:
+        mm.close()
+
+def level_scan(raw):
+    """
+    Return a same-length mask of raw where every level byte is _LEVEL_MARK and every
+    other byte is 0x00. scan.find(_LEVEL_MARK, i) then jumps straight to the next
+    candidate record start instead of walking the buffer byte by byte in Python.
+    """
+    if isinstance(raw, bytes):
+        return raw.translate(_LEVEL_TRANSLATE)
+    mv = memoryview(raw)
+    n = len(mv)
+    scan = bytearray(n)
+    for a in range(0, n, _SCAN_CHUNK):
+        b = min(n, a + _SCAN_CHUNK)
+        scan[a:b] = mv[a:b].tobytes().translate(_LEVEL_TRANSLATE)
+    mv.release()
+    return scan
+
+def marker_positions(raw, needle):
+    """Sorted offsets of every occurrence of the single byte needle in raw."""
+    positions = []
+    p = raw.find(needle)
+    while p != -1:
+        positions.append(p)
+        p = raw.find(needle, p+1)
+    return positions
+
+def next_after(positions):
+    """Lookup over sorted offsets: next(j) -> first offset > j, or -1."""
+    count = len(positions)
+    def lookup(j):
+        idx = bisect_right(positions, j)
+        return positions[idx] if idx < count else -1
+    return lookup
+
+if njit is not None and np is not None:
+    @njit(cache=True)
+    def _scan_records(arr, level_mask, sob, eob):
+        """
+        Single compiled pass over the buffer collecting level/SOB/EOB offsets.
+        Counted first so the output arrays are sized exactly, not len(arr) each.
+        """
+        n = arr.shape[0]
+        n_level = n_sob = n_eob = 0
+        for i in range(n):
+            b = arr[i]
+            if level_mask[b]:
+                n_level += 1
+            if b == sob:
+                n_sob += 1
+            elif b == eob:
+                n_eob += 1
+        level_pos = np.empty(n_level, np.int64)
+        sob_pos = np.empty(n_sob, np.int64)
+        eob_pos = np.empty(n_eob, np.int64)
+        n_level = n_sob = n_eob = 0
+        for i in range(n):
+            b = arr[i]
+            if level_mask[b]:
+                level_pos[n_level] = i
+                n_level += 1
+            if b == sob:
+                sob_pos[n_sob] = i
+                n_sob += 1
+            elif b == eob:
+                eob_pos[n_eob] = i
+                n_eob += 1
+        return level_pos, sob_pos, eob_pos
+else:
+    _scan_records = None
+
+def index_records(raw):
+    """
+    Index every record marker once, up front, and return the lookups parse_logs uses:
+      next_level(k) -> offset of the first level byte >= k, or -1
+      next_sob(j)   -> offset of the first SOB byte > j, or -1
+      next_eob(j)   -> offset of the first EOB byte > j, or -1
+    Each marker byte is therefore examined exactly once per parse: parse_logs never
+    re-runs an open-ended find() over the remaining buffer, however malformed it is.
+    With numba the offsets come from one compiled loop (_scan_records), with numpy alone
+    from one vectorized sweep per marker; otherwise SOB/EOB are collected with find()
+    and level bytes through the translated mask of level_scan().
+    Lookups use bisect on plain lists (per-call np.searchsorted overhead would dominate).
+    """
+    if np is not None and len(raw):
+        arr = np.frombuffer(raw, dtype=np.uint8)
+        if _scan_records is not None:
+            level_pos, sob_pos, eob_pos = (p.tolist() for p in _scan_records(arr, _LEVEL_MASK_NP, LOG_HDR_SOB, LOG_HDR_EOB))
+        else:
+            level_pos = np.flatnonzero(_LEVEL_MASK_NP[arr]).tolist()
+            sob_pos = np.flatnonzero(arr == LOG_HDR_SOB).tolist()
+            eob_pos = np.flatnonzero(arr == LOG_HDR_EOB).tolist()
+        del arr  # don't keep an export on the buffer (an mmap can't close while exported)
+        level_count = len(level_pos)
+
+        def next_level(k):
+            idx = bisect_left(level_pos, k)
+            return level_pos[idx] if idx < level_count else -1
+
+        return next_level, next_after(sob_pos), next_after(eob_pos)
+
+    scan = level_scan(raw)
+
+    def next_level(k):
+        return scan.find(_LEVEL_MARK, k)
+
+    return next_level, next_after(marker_positions(raw, _SOB)), next_after(marker_positions(raw, _EOB))
+
+def index_packets(raw):
+    """
+    Return find_marker(needle, k) -> offset of the first _SDB/_MDB/_EDB marker >= k, or -1.
+    With numpy every marker offset is located up front in one vectorized sweep per
+    marker and looked up with bisect; otherwise this is just raw.find().
+    """
+    if np is None or not len(raw):
+        return raw.find
+
+    arr = np.frombuffer(raw, dtype=np.uint8)
+    positions = {
+        _SDB: np.flatnonzero(arr == DATA_HDR_SDB).tolist(),
+        _MDB: np.flatnonzero(arr == DATA_HDR_MDB).tolist(),
+        _EDB: np.flatnonzero(arr == DATA_HDR_EDB).tolist(),
+    }
+    del arr  # don't keep an export on the buffer
+
+    def find_marker(needle, k):
+        pos = positions[needle]
+        idx = bisect_left(pos, k)
+        return pos[idx] if idx < len(pos) else -1
+
+    return find_marker
+
 def bytes_to_printable(bts, maxlen=1024):
     try:
         s = bts.decode("utf-8", "replace")
@@ -141,140 +350,222 @@ def bytes_to_printable(bts, maxlen=1024):
     except Exception:
         return binascii.hexlify(bts).decode()
 
+def search_text(message, origin, domain_name):
+    """Lowercased text the filter box searches in, built once per entry at parse time."""
+    return f"{message} {origin} {domain_name or ''}".lower()
+
+def level_mask(level_names):
+    """Bitmask with bit n set for every selected level whose byte value is n."""
+    mask = 0
+    for name in level_names:
+        mask |= 1 << LOG_LEVELS[name][0]
+    return mask
+
 # -----------------------
 # Parsing functions
 # -----------------------
 
+class LogEntry:
+    """
+    One parsed log record. Slotted rather than a dict per record: large logs keep
+    tens of thousands of these alive and the attribute access is cheaper too.
+    """
+    __slots__ = (
+        "pos", "level_int", "level_name", "timestamp_str", "timestamp_raw", "timestamp_fmt",
+        "origin", "origin_raw", "domain_int", "domain_name", "message", "message_raw", "raw", "_lc",
+    )
+
+    def __init__(self, pos, level_int, level_name, timestamp_str, timestamp_raw, timestamp_fmt,
+                 origin, origin_raw, domain_int, domain_name, message, message_raw, raw):
+        self.pos = pos
+        self.level_int = level_int
+        self.level_name = level_name
+        self.timestamp_str = timestamp_str
+        self.timestamp_raw = timestamp_raw
+        self.timestamp_fmt = timestamp_fmt
+        self.origin = origin
+        self.origin_raw = origin_raw
+        self.domain_int = domain_int
+        self.domain_name = domain_name
+        self.message = message
+        self.message_raw = message_raw
+        self.raw = raw
+        # lowercased text the filter box searches in, built once at parse time
+        self._lc = search_text(message, origin, domain_name)
+
 def parse_logs(raw: bytes):
     """
     Parse log entries heuristically from raw bytes.
-    Returns list of dicts:
-      {pos, level_int, level_name, timestamp_str, ts_raw_bytes, origin, domain_int, domain_name, message, raw_bytes}
+    Returns list of LogEntry:
+      (pos, level_int, level_name, timestamp_str, timestamp_raw, timestamp_fmt, origin, origin_raw, domain_int, domain_name, message, message_raw, raw)
     The parser scans for bytes that match known level bytes and attempts to parse each record.
     """
     entries = []
     n = len(raw)
     i = 0
-    level_byte_values = set(LEVEL_BY_INT.keys())
+    # view for scan-only windows: slicing it is O(1), nothing gets copied.
+    # Anything stored in an entry is still materialized as bytes so the
+    # entries never pin the underlying buffer (e.g. an mmap that gets closed).
+    mv = memoryview(raw)
+
+    next_level, next_sob, next_eob = index_records(raw)
 
     # helper to find next record start index given a current index
     def find_next_start(start_idx):
-        for j in range(start_idx+1, n):
-            if raw[j] in level_byte_values:
-                # quick check: there should be a LOG_HDR_SOB somewhere after j (within next 64 bytes) - suggests start
-                if raw.find(bytes([LOG_HDR_SOB]), j+1, min(n, j+1+128)) != -1:
-                    return j
+        j = next_level(start_idx+1)
+        while j != -1:
+            # quick check: there should be a LOG_HDR_SOB somewhere after j (within next 128 bytes) - suggests start
+            sob = next_sob(j)
+            if sob == -1:
+                return -1
+            if sob - j <= _SOB_WINDOW:
+                return j
+            # every level byte before sob-_SOB_WINDOW sees the same SOB, too far away
+            j = next_level(sob - _SOB_WINDOW)
         return -1
 
     while i < n:
-        b = raw[i]
-        if b in level_byte_values:
-            # attempt to parse record starting at i
-            level_int = b
-            level_name = LEVEL_BY_INT.get(level_int, f"0x{level_int:02x}")
-            # find next SOB after i
-            pos_sob = raw.find(bytes([LOG_HDR_SOB]), i+1)
-            if pos_sob == -1:
-                # no SOB -> cannot parse; treat rest as message
-                message = raw[i+1:]
-                ts_str, ts_val, ts_fmt = ("<no-timestamp>", None, None)
-                entries.append({
-                    "pos": i,
-                    "level_int": level_int,
-                    "level_name": level_name,
-                    "timestamp_str": ts_str,
-                    "timestamp_raw": b'',
-                    "timestamp_fmt": ts_fmt,
-                    "origin": "<no-origin>",
-                    "origin_raw": b'',
-                    "domain_int": None,
-                    "domain_name": None,
-                    "message": bytes_to_printable(message),
-                    "raw": raw[i:],
-                })
-                break
-            # timestamp bytes are between i+1 and pos_sob
-            ts_bytes = raw[i+1:pos_sob]
-            ts_str, ts_val, ts_fmt = human_time_from_timestamp_bytes(ts_bytes)
-
-            # find EOB after pos_sob
-            pos_eob = raw.find(bytes([LOG_HDR_EOB]), pos_sob+1)
-            if pos_eob == -1:
-                # broken origin; take rest as message
-                origin_bytes = raw[pos_sob+1:]
+        # jump to the next level byte
+        i = next_level(i)
+        if i == -1:
+            break
+        # attempt to parse record starting at i
+        level_int = mv[i]
+        level_name = LEVEL_BY_INT.get(level_int, f"0x{level_int:02x}")
+        # find next SOB after i
+        pos_sob = next_sob(i)
+        if pos_sob == -1:
+            # no SOB -> cannot parse; treat rest as message
+            message = bytes_to_printable(raw[i+1:])
+            ts_str, ts_val, ts_fmt = ("<no-timestamp>", None, None)
+            entries.append(LogEntry(
+                pos=i,
+                level_int=level_int,
+                level_name=level_name,
+                timestamp_str=ts_str,
+                timestamp_raw=b'',
+                timestamp_fmt=ts_fmt,
+                origin="<no-origin>",
+                origin_raw=b'',
+                domain_int=None,
+                domain_name=None,
+                message=message,
+                message_raw=raw[i+1:],
+                raw=raw[i:],
+            ))
+            break
+        # timestamp bytes are between i+1 and pos_sob (bytes, so they can key the cache)
+        ts_bytes = bytes(mv[i+1:pos_sob])
+        ts_str, ts_val, ts_fmt = human_time_from_timestamp_bytes(ts_bytes)
+
+        # find EOB after pos_sob
+        pos_eob = next_eob(pos_sob)
+        if pos_eob == -1:
+            # broken origin; take rest as message
+            origin_bytes = raw[pos_sob+1:]
+            origin = bytes_to_printable(origin_bytes)
+            domain_int = None
+            domain_name = None
+            msg_start = n
+        else:
+            origin_bytes = raw[pos_sob+1:pos_eob]
+            try:
+                # the same few origins repeat on every record: share one string each
+                origin = sys.intern(origin_bytes.decode("utf-8", "ignore"))
+            except Exception:
                 origin = bytes_to_printable(origin_bytes)
-                domain_int = None
-                domain_name = None
-                msg_start = n
-            else:
-                origin_bytes = raw[pos_sob+1:pos_eob]
-                try:
-                    origin = origin_bytes.decode("utf-8", "ignore")
-                except Exception:
-                    origin = bytes_to_printable(origin_bytes)
-                msg_start = pos_eob+1
-                # attempt to read domain: prefer 1 byte (if maps), otherwise try to find first non-zero single-byte in next 4 bytes
-                domain_int = None
-                domain_name = None
-                if msg_start < n:
-                    candidate = raw[msg_start]
-                    if candidate in LOGGING_TABLE_REV:
-                        domain_int = candidate
-                        domain_name = LOGGING_TABLE_REV.get(domain_int, f"0x{domain_int:02x}")
+            msg_start = pos_eob+1
+            # attempt to read domain: prefer 1 byte (if maps), otherwise try to find first non-zero single-byte in next 4 bytes
+            domain_int = None
+            domain_name = None
+            if msg_start < n:
+                candidate = mv[msg_start]
+                if candidate in LOGGING_TABLE_REV:
+                    domain_int = candidate
+                    domain_name = LOGGING_TABLE_REV.get(domain_int, f"0x{domain_int:02x}")
+                    msg_start += 1
+                else:
+                    # sometimes domain may be encoded as a single byte number but value could be zero (UNKNOWN=0)
+                    # if first byte is 0 and mapping has 0, accept
+                    if candidate == 0 and 0 in LOGGING_TABLE_REV:
+                        domain_int = 0
+                        domain_name = LOGGING_TABLE_REV[0]
                         msg_start += 1
                     else:
-                        # sometimes domain may be encoded as a single byte number but value could be zero (UNKNOWN=0)
-                        # if first byte is 0 and mapping has 0, accept
-                        if candidate == 0 and 0 in LOGGING_TABLE_REV:
-                            domain_int = 0
-                            domain_name = LOGGING_TABLE_REV[0]
-                            msg_start += 1
-                        else:
-                            # other code path: domain might have been encoded incorrectly (bytes(n) in original)
-                            # try scanning next 4 bytes for a small integer value
-                            look = raw[msg_start:msg_start+4]
-                            found = None
-                            for offset in range(len(look)):
-                                v = look[offset]
-                                if v in LOGGING_TABLE_REV:
-                                    found = (v, offset)
-                                    break
-                            if found:
-                                domain_int, off = found
-                                domain_name = LOGGING_TABLE_REV.get(domain_int, None)
-                                msg_start += (off+1)
-                # else no domain, message directly follows
-
-            # determine end of message: heuristics -> next record start
-            next_start = find_next_start(msg_start-1)
-            if next_start == -1:
-                message_bytes = raw[msg_start:]
-                next_i = n
-            else:
-                message_bytes = raw[msg_start:next_start]
-                next_i = next_start
-
-            entries.append({
-                "pos": i,
-                "level_int": level_int,
-                "level_name": level_name,
-                "timestamp_str": ts_str,
-                "timestamp_raw": ts_bytes,
-                "timestamp_fmt": ts_fmt,
-                "origin": origin,
-                "origin_raw": origin_bytes,
-                "domain_int": domain_int,
-                "domain_name": domain_name,
-                "message": bytes_to_printable(message_bytes),
-                "message_raw": message_bytes,
-                "raw": raw[i:next_i],
-            })
-            i = next_i
+                        # other code path: domain might have been encoded incorrectly (bytes(n) in original)
+                        # try scanning next 4 bytes for a small integer value
+                        look = mv[msg_start:msg_start+4]
+                        found = None
+                        for offset in range(len(look)):
+                            v = look[offset]
+                            if v in LOGGING_TABLE_REV:
+                                found = (v, offset)
+                                break
+                        if found:
+                            domain_int, off = found
+                            domain_name = LOGGING_TABLE_REV.get(domain_int, None)
+                            msg_start += (off+1)
+            # else no domain, message directly follows
+
+        # determine end of message: heuristics -> next record start
+        next_start = find_next_start(msg_start-1)
+        if next_start == -1:
+            message_bytes = raw[msg_start:]
+            next_i = n
         else:
-            i += 1
+            message_bytes = raw[msg_start:next_start]
+            next_i = next_start
+        message = bytes_to_printable(message_bytes)
+
+        entries.append(LogEntry(
+            pos=i,
+            level_int=level_int,
+            level_name=level_name,
+            timestamp_str=ts_str,
+            timestamp_raw=ts_bytes,
+            timestamp_fmt=ts_fmt,
+            origin=origin,
+            origin_raw=origin_bytes,
+            domain_int=domain_int,
+            domain_name=domain_name,
+            message=message,
+            message_raw=message_bytes,
+            raw=raw[i:next_i],
+        ))
+        i = next_i
 
+    mv.release()
     return entries
 
+def parse_logs_stream(f, base=0, chunk_size=LOG_STREAM_CHUNK):
+    """
+    Parse log entries from an open binary file window by window and yield them in order.
+    base is the file offset f is positioned at; yielded "pos" values are file offsets.
+    Entries ending within _STREAM_OVERLAP bytes of a window's end may still change once
+    more data follows, so their bytes are carried into the next window and parsed again.
+    Only about one window of raw file data is held at a time.
+    """
+    carry = b""
+    while True:
+        data = f.read(chunk_size)
+        if not data:
+            for ent in parse_logs(carry):
+                ent.pos += base
+                yield ent
+            return
+        buf = carry + data if carry else data
+        keep = len(buf) - _STREAM_OVERLAP
+        # no entries means no level byte at all: nothing worth carrying
+        cut = len(buf)
+        for ent in parse_logs(buf):
+            if ent.pos + len(ent.raw) > keep:
+                cut = ent.pos
+                break
+            ent.pos += base
+            yield ent
+        carry = buf[cut:]
+        base += cut
+
 def parse_data_packets(raw: bytes):
     """
     Parse data packets formatted as:
@@ -284,16 +575,17 @@ def parse_data_packets(raw: bytes):
     entries = []
     idx = 0
     n = len(raw)
+    find_marker = index_packets(raw)
     while idx < n:
-        pos = raw.find(bytes([DATA_HDR_SDB]), idx)
+        pos = find_marker(_SDB, idx)
         if pos == -1:
             break
         pos_name_start = pos + 1
-        pos_mdb = raw.find(bytes([DATA_HDR_MDB]), pos_name_start)
+        pos_mdb = find_marker(_MDB, pos_name_start)
         if pos_mdb == -1:
             break
         name_raw = raw[pos_name_start:pos_mdb]
-        pos_edb = raw.find(bytes([DATA_HDR_EDB]), pos_mdb+1)
+        pos_edb = find_marker(_EDB, pos_mdb+1)
         if pos_edb == -1:
             break
         value_raw = raw[pos_mdb+1:pos_edb]
@@ -333,6 +625,19 @@ class PicoLogViewer(tk.Tk):
         self.tail_running = False
         self.last_log_mtime = None
         self.last_data_mtime = None
+        # indices into parsed_logs passing the current filters, and how many are in the tree
+        self._visible_indices = []
+        self._tree_filled = 0
+        # files are read and parsed on a worker thread so the UI stays responsive
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._log_future = None
+        self._data_future = None
+        # state for incremental tail reads: leading bytes and size of the parsed log
+        self._log_head = b""
+        self._log_read_offset = 0
+        # record shown in the raw hex view and how many of its bytes are rendered
+        self._hex_raw = b""
+        self._hex_shown = 0
 
     def create_widgets(self):
         # Top controls frame
@@ -407,6 +712,7 @@ class PicoLogViewer(tk.Tk):
         self.tree.column("message", width=420)
         self.tree.pack(side="top", fill="both", expand=True)
         self.tree.bind("<<TreeviewSelect>>", self.on_select_entry)
+        self.tree.configure(yscrollcommand=self.on_tree_scroll)
 
         # Bottom controls for logs
         bottom_controls = ttk.Frame(leftframe)
@@ -422,7 +728,7 @@ class PicoLogViewer(tk.Tk):
         self.details_text.pack(side="top", fill="both", expand=True)
         # Raw hex view
         ttk.Label(rightframe, text="Raw (hex):").pack(side="top", anchor="w")
-        self.hex_text = tk.Text(rightframe, height=8, wrap="none")
+        self.hex_text = tk.Text(rightframe, height=8, wrap="none", xscrollcommand=self.on_hex_scroll)
         self.hex_text.pack(side="top", fill="x", expand=False)
 
         # Data tab below logs
@@ -467,50 +773,130 @@ class PicoLogViewer(tk.Tk):
         if not os.path.exists(path):
             messagebox.showerror("File not found", f"Log file not found: {path}")
             return
-        try:
-            with open(path, "rb") as f:
-                raw = f.read()
-            self.parsed_logs = parse_logs(raw)
-            self.update_log_view()
-            self.set_status(f"Loaded {len(self.parsed_logs)} log entries from {os.path.basename(path)}")
-            self.log_file = path
-            self.last_log_mtime = os.path.getmtime(path)
-        except Exception as e:
-            traceback.print_exc()
-            messagebox.showerror("Error parsing logs", str(e))
+        if self._log_future is not None and not self._log_future.done():
+            return  # previous load still parsing; tail/refresh will pick up later changes
+        # the log only grew: re-parse from the start of the last record (it may have
+        # been cut off mid-write) instead of re-reading the whole file
+        resume = None
+        if self.parsed_logs and path == self.log_file and os.path.getsize(path) > self._log_read_offset:
+            resume = (self._log_head, self.parsed_logs[-1].pos)
+        self.set_status(f"Loading {os.path.basename(path)} ...")
+        self._log_future = self._executor.submit(self.read_and_parse_logs, path, resume)
+        self.wait_for(self._log_future, self.apply_parsed_logs, "Error parsing logs")
+
+    @staticmethod
+    def read_and_parse_logs(path, resume=None):
+        # runs on the worker thread: no Tk calls in here
+        mtime = os.path.getmtime(path)
+        with open(path, "rb") as f:
+            head = f.read(LOG_HEAD_CHECK)
+            resumed_at = None
+            if resume is not None:
+                old_head, resume_at = resume
+                # same leading bytes: the file was only appended to. Otherwise it was
+                # replaced or rotated and is parsed in full.
+                if head[:len(old_head)] == old_head:
+                    resumed_at = resume_at
+            start = resumed_at or 0
+            f.seek(start)
+            entries = list(parse_logs_stream(f, start))
+            offset = f.tell()
+        return path, mtime, entries, resumed_at, head, offset
+
+    def apply_parsed_logs(self, result):
+        path, mtime, entries, resumed_at, head, offset = result
+        if resumed_at is None:
+            self.parsed_logs = entries
+        else:
+            # the last record was parsed again together with the appended bytes
+            if self.parsed_logs and self.parsed_logs[-1].pos == resumed_at:
+                self.parsed_logs.pop()
+            self.parsed_logs.extend(entries)
+        self._log_head = head
+        self._log_read_offset = offset
+        self.update_log_view()
+        self.set_status(f"Loaded {len(self.parsed_logs)} log entries from {os.path.basename(path)}")
+        self.log_file = path
+        self.last_log_mtime = mtime
 
     def load_data(self):
         path = self.data_path_var.get()
         if not os.path.exists(path):
             messagebox.showerror("File not found", f"Data file not found: {path}")
             return
+        if self._data_future is not None and not self._data_future.done():
+            return
+        self.set_status(f"Loading {os.path.basename(path)} ...")
+        self._data_future = self._executor.submit(self.read_and_parse_data, path)
+        self.wait_for(self._data_future, self.apply_parsed_data, "Error parsing data")
+
+    @staticmethod
+    def read_and_parse_data(path):
+        # runs on the worker thread: no Tk calls in here
+        mtime = os.path.getmtime(path)
+        mm = map_file(path)
+        try:
+            # entries hold bytes copies, so the mapping isn't needed past this point;
+            # an open mapping would keep data.bin locked on Windows
+            return path, mtime, parse_data_packets(mm)
+        finally:
+            close_map(mm)
+
+    def apply_parsed_data(self, result):
+        path, mtime, entries = result
+        self.parsed_data = entries
+        self.data_tree.delete(*self.data_tree.get_children())
+        for ent in self.parsed_data:
+            self.data_tree.insert("", "end", values=(ent["pos"], ent["name"], ent["value"]))
+        self.set_status(f"Loaded {len(self.parsed_data)} data packets from {os.path.basename(path)}")
+        self.data_file = path
+        self.last_data_mtime = mtime
+
+    def wait_for(self, future, on_done, error_title):
+        """
+        Poll a worker future from the Tk loop and pass its result to on_done.
+        Tk must only be touched from the main thread, so the worker never calls back into it.
+        """
+        if not future.done():
+            self.after(PARSE_POLL_MS, self.wait_for, future, on_done, error_title)
+            return
         try:
-            with open(path, "rb") as f:
-                raw = f.read()
-            self.parsed_data = parse_data_packets(raw)
-            self.data_tree.delete(*self.data_tree.get_children())
-            for ent in self.parsed_data:
-                self.data_tree.insert("", "end", values=(ent["pos"], ent["name"], ent["value"]))
-            self.set_status(f"Loaded {len(self.parsed_data)} data packets from {os.path.basename(path)}")
-            self.data_file = path
-            self.last_data_mtime = os.path.getmtime(path)
+            on_done(future.result())
         except Exception as e:
             traceback.print_exc()
-            messagebox.showerror("Error parsing data", str(e))
+            messagebox.showerror(error_title, str(e))
 
     def update_log_view(self):
         # Apply filters and update tree
         search = self.search_var.get().lower().strip()
-        selected_levels = {lvl for lvl,v in self.level_vars.items() if v.get()}
+        selected = level_mask(lvl for lvl,v in self.level_vars.items() if v.get())
         self.tree.delete(*self.tree.get_children())
+        visible = []
         for idx, ent in enumerate(self.parsed_logs):
-            if ent["level_name"] not in selected_levels:
+            if not (selected >> ent.level_int) & 1:
                 continue
-            full_text = f'{ent.get("message","")} {ent.get("origin","")} {ent.get("domain_name","")}'
-            if search and search not in full_text.lower():
+            if search and search not in ent._lc:
                 continue
-            self.tree.insert("", "end", iid=str(idx), values=(ent.get("timestamp_str",""), ent.get("level_name",""), ent.get("origin",""), ent.get("domain_name") or "", ent.get("message","")))
-        self.set_status(f"Showing {len(self.tree.get_children())} / {len(self.parsed_logs)} entries")
+            visible.append(idx)
+        # only the first page goes into the tree now, the rest follows on scroll
+        self._visible_indices = visible
+        self._tree_filled = 0
+        self.fill_tree_page()
+        self.set_status(f"Showing {len(visible)} / {len(self.parsed_logs)} entries")
+
+    def fill_tree_page(self):
+        start = self._tree_filled
+        end = min(start + TREE_PAGE_SIZE, len(self._visible_indices))
+        insert = self.tree.insert
+        for idx in self._visible_indices[start:end]:
+            ent = self.parsed_logs[idx]
+            insert("", "end", iid=str(idx), values=(ent.timestamp_str, ent.level_name, ent.origin, ent.domain_name or "", ent.message))
+        self._tree_filled = end
+
+    def on_tree_scroll(self, first, last):
+        # yscrollcommand: append the next page once the user nears the bottom
+        if float(last) >= 0.9 and self._tree_filled < len(self._visible_indices):
+            self.fill_tree_page()
 
     def clear_search(self):
         self.search_var.set("")
@@ -524,20 +910,19 @@ class PicoLogViewer(tk.Tk):
         ent = self.parsed_logs[idx]
         self.details_text.delete("1.0", "end")
         details = []
-        details.append(f"Position: {ent.get('pos')}")
-        details.append(f"Level: {ent.get('level_name')} (0x{ent.get('level_int'):02x})")
-        details.append(f"Timestamp: {ent.get('timestamp_str')}  (fmt: {ent.get('timestamp_fmt')})")
-        details.append(f"Origin: {ent.get('origin')}")
-        details.append(f"Domain: {ent.get('domain_name')} (raw: {ent.get('domain_int')})")
+        details.append(f"Position: {ent.pos}")
+        details.append(f"Level: {ent.level_name} (0x{ent.level_int:02x})")
+        details.append(f"Timestamp: {ent.timestamp_str}  (fmt: {ent.timestamp_fmt})")
+        details.append(f"Origin: {ent.origin}")
+        details.append(f"Domain: {ent.domain_name} (raw: {ent.domain_int})")
         details.append("Message:")
-        details.append(ent.get("message",""))
+        details.append(ent.message)
         details.append("")
         details.append("Raw bytes (decoded where possible):")
         # show hex of entry raw
-        raw = ent.get("raw", b"")
+        raw = ent.raw
         self.details_text.insert("1.0", "\n".join(details))
-        self.hex_text.delete("1.0", "end")
-        self.hex_text.insert("1.0", binascii.hexlify(raw).decode())
+        self.show_hex(raw)
 
     def on_select_data(self, event):
         sel = self.data_tree.selection()
@@ -556,8 +941,25 @@ class PicoLogViewer(tk.Tk):
         out.append("Raw name (hex): " + binascii.hexlify(ent['name_raw']).decode())
         out.append("Raw value (hex): " + binascii.hexlify(ent['value_raw']).decode())
         self.details_text.insert("1.0", "\n".join(out))
+        self.show_hex(ent['raw'])
+
+    def show_hex(self, raw):
+        # only the first HEX_CHUNK bytes are rendered now, the rest follows on scroll
+        self._hex_raw = raw
+        self._hex_shown = 0
         self.hex_text.delete("1.0", "end")
-        self.hex_text.insert("1.0", binascii.hexlify(ent['raw']).decode())
+        self.append_hex_chunk()
+
+    def append_hex_chunk(self):
+        start = self._hex_shown
+        end = min(start + HEX_CHUNK, len(self._hex_raw))
+        self.hex_text.insert("end", memoryview(self._hex_raw)[start:end].hex())
+        self._hex_shown = end
+
+    def on_hex_scroll(self, first, last):
+        # xscrollcommand: the hex dump is one long line, append more near its end
+        if float(last) >= 0.9 and self._hex_shown < len(self._hex_raw):
+            self.append_hex_chunk()
 
     def export_selected(self):
         sel = self.tree.selection()
@@ -571,7 +973,7 @@ class PicoLogViewer(tk.Tk):
             with open(export_path, "w", encoding="utf-8") as f:
                 for item in sel:
                     ent = self.parsed_logs[int(item)]
-                    f.write(f"[{ent.get('timestamp_str')}] {ent.get('level_name')} ({ent.get('origin')} | {ent.get('domain_name')}) {ent.get('message')}\n")
+                    f.write(f"[{ent.timestamp_str}] {ent.level_name} ({ent.origin} | {ent.domain_name}) {ent.message}\n")
             messagebox.showinfo("Export complete", f"Exported {len(sel)} entries to {export_path}")
         except Exception as e:
             messagebox.showerror("Export failed", str(e))
@@ -586,7 +988,7 @@ class PicoLogViewer(tk.Tk):
         try:
             with open(export_path, "w", encoding="utf-8") as f:
                 for ent in self.parsed_logs:
-                    f.write(f"[{ent.get('timestamp_str')}] {ent.get('level_name')} ({ent.get('origin')} | {ent.get('domain_name')}) {ent.get('message')}\n")
+                    f.write(f"[{ent.timestamp_str}] {ent.level_name} ({ent.origin} | {ent.domain_name}) {ent.message}\n")
             messagebox.showinfo("Export complete", f"Exported {len(self.parsed_logs)} entries to {export_path}")
         except Exception as e:
             messagebox.showerror("Export failed", str(e))
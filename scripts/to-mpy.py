@@ -1,12 +1,36 @@
 import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    # imported once: mpy_cross.run() starts the bundled native compiler directly,
+    # without a fresh Python interpreter + package import per file
+    import mpy_cross
+except ImportError:
+    mpy_cross = None
+
+def _compile_one(src, dst):
+    if mpy_cross is not None:
+        proc = mpy_cross.run(src, "-o", dst, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        _, stderr = proc.communicate()
+        return src, dst, proc.returncode, stderr
+
+    result = subprocess.run(
+        [sys.executable, "-m", "mpy_cross", src, "-o", dst],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    return src, dst, result.returncode, result.stderr
 
 def compile_core(source_dir="./core", output_dir="./build/core"):
     if not os.path.isdir(source_dir):
         print(f"[!] {source_dir} directory not found")
         sys.exit(1)
 
+    # collect every (src, dst) pair first, then compile them concurrently
+    jobs = []
     for root, _, files in os.walk(source_dir):
         for filename in files:
             if filename.endswith(".py"):
@@ -21,19 +45,24 @@ def compile_core(source_dir="./core", output_dir="./build/core"):
                 # compiled file path
                 dst = os.path.join(dst_dir, filename[:-3] + ".mpy")
 
+                # incremental build: skip sources older than their compiled output
+                if os.path.exists(dst) and os.path.getmtime(dst) >= os.path.getmtime(src):
+                    print(f"[=] Up-to-date: {dst}")
+                    continue
+
                 print(f"[+] Compiling {src} → {dst}")
-                result = subprocess.run(
-                    [sys.executable, "-m", "mpy_cross", src, "-o", dst],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                )
-
-                if result.returncode != 0:
-                    print(f"[!] Failed: {src}")
-                    print(result.stderr)
-                else:
-                    print(f"[I] Compiled: {dst}")
+                jobs.append((src, dst))
+
+    # each job mostly waits on its mpy_cross process, so threads are enough
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as ex:
+        futures = [ex.submit(_compile_one, src, dst) for src, dst in jobs]
+        for future in as_completed(futures):
+            src, dst, returncode, stderr = future.result()
+            if returncode != 0:
+                print(f"[!] Failed: {src}")
+                print(stderr)
+            else:
+                print(f"[I] Compiled: {dst}")
 if __name__ == "__main__":
     subprocess.run([sys.executable, "-m", "mpy_cross", "--version"])
 
@@ -41,4 +70,3 @@ if __name__ == "__main__":
         compile_core(sys.argv[1], sys.argv[2])
     else:
         compile_core()
-
@@ -4,6 +4,7 @@ def init():
     from core.constants.constants import LOG_LEVELS
     from core.config import get_config
     from core.utils.utils import sync_rtc
+    from core.utils import error
     from core.services.servicemanager import service_manager
     from core.services import health
     from core.services import led
@@ -22,6 +23,7 @@ def init():
         get_config().get("system.logger.log_to_file"),
         get_config().get("system.logger.log_to_console")
     )
+    error.set_logger(logger.logger_instance)
 
     # Register System services
     # ------------------------------------
@@ -34,7 +36,7 @@ def init():
 
     # Priority: 1
     if get_config().get("system.health.onboard_status_led"):
-        service_manager.register("LED", 1, led.LED)
+        service_manager.register("LED", 1, led.LED, 2, "custom", 3, 60)
 
     # Start the Services
     service_manager.startAll()
\ No newline at end of file
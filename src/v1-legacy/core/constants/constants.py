@@ -28,7 +28,25 @@ LOG_LEVELS = {
     "OFF": LVL_OFF,
 }
 
-LOG_LEVELS_REV = {v: k for k, v in LOG_LEVELS.items()}
+# level names indexed by the level byte value (LVL_X[0]); a tuple literal stays in ROM when frozen
+LOG_LEVELS_REV = (
+    "OFF",
+    "UNKNOWN",
+    "DEBUG",
+    "INFO",
+    "WARN",
+    "CRITICAL",
+    "FATAL",
+)
+
+# Severity levels as plain ints (LVL_X[0]) for the logger's per-call level check
+LVL_FATAL_INT    = const(6)
+LVL_CRITICAL_INT = const(5)
+LVL_WARN_INT     = const(4)
+LVL_INFO_INT     = const(3)
+LVL_DEBUG_INT    = const(2)
+LVL_UNKNOWN_INT  = const(1)
+LVL_OFF_INT      = const(0)
 
 
 # logging Constants
@@ -65,30 +83,43 @@ LOGGING_TABLE = {
     OVERFLOW : 12
 }
 
-LOGGING_TABLE_REV = {v: k for k, v in LOGGING_TABLE.items()}
+# domain names indexed by domain id, same order as LOGGING_TABLE
+LOGGING_TABLE_REV = (
+    UNKNOWN,
+    SERVICE_INIT,
+    SERVICE_START,
+    SERVICE_STOP,
+    SERVICE_RESTART,
+    PARAMETER,
+    BOARD_TEMP,
+    SYSTEM_RESTART,
+    SYSTEM,
+    CPU,
+    RAM,
+    FLASH_MEM,
+    OVERFLOW,
+)
 
 # DOMAIN means part of the system or aspect like SERVICE or CPU or UNKNOWN
 
+# byte encodings precomputed at import: name -> domain byte, int -> encoded name
+DOMAIN_STR_TO_BYTES = {k: v.to_bytes(1, "big") for k, v in LOGGING_TABLE.items()}
+DOMAIN_INT_TO_NAME_BYTES = {i: k.encode("utf-8") for i, k in enumerate(LOGGING_TABLE_REV)}
+# str and int keys can't collide, so byte mode is a single lookup in the union
+_DOMAIN_BYTES = dict(DOMAIN_STR_TO_BYTES)
+_DOMAIN_BYTES.update(DOMAIN_INT_TO_NAME_BYTES)
+
 def domain_to(domain: str | int, byte=False):
     """
     Convert domain name <-> int <-> bytes.
     """
     if byte:
-        if isinstance(domain, str):
-            if domain in LOGGING_TABLE:
-                return LOGGING_TABLE[domain].to_bytes(1, "big")  # int -> byte
-            return b""
-        elif isinstance(domain, int):
-            if domain in LOGGING_TABLE_REV:
-                return LOGGING_TABLE_REV[domain].encode("utf-8")  # str -> bytes
-            return b""
-        else:
-            return b""
+        return _DOMAIN_BYTES.get(domain, b"")
 
     # Non-byte mode
     if isinstance(domain, str) and domain in LOGGING_TABLE:
         return LOGGING_TABLE[domain]
-    elif isinstance(domain, int) and domain in LOGGING_TABLE_REV:
+    elif isinstance(domain, int) and 0 <= domain < len(LOGGING_TABLE_REV):
         return LOGGING_TABLE_REV[domain]
 
     return None
@@ -106,13 +137,31 @@ ERROR_TABLE = {
     },
 }
 
+# ERROR_TABLE flattened into a list indexed by domain_int * ERROR_LEVELS + level_int,
+# so a lookup is one index instead of two dict lookups on str/bytes keys
+ERROR_LEVELS = const(8)
+ERROR_FLAT = [None] * (len(LOGGING_TABLE) * ERROR_LEVELS)
+
+def error_index(level: bytes | int, domain: str | int) -> int:
+    """
+    Index of (level, domain) in ERROR_FLAT, or -1 if the domain is unknown.
+    """
+    if isinstance(domain, str):
+        domain = LOGGING_TABLE.get(domain)
+    if not isinstance(domain, int) or not 0 <= domain < len(LOGGING_TABLE):
+        return -1
+    return domain * ERROR_LEVELS + (level if isinstance(level, int) else level[0])
+
+for _domain, _levels in ERROR_TABLE.items():
+    for _level, _entry in _levels.items():
+        ERROR_FLAT[error_index(_level, _domain)] = _entry
+
 def getError(severity, code):
     """
     Retrieve error details based on both severity and code.
     """
-    if code in ERROR_TABLE and severity in ERROR_TABLE[code]:
-        return ERROR_TABLE[code][severity]
-    return None
+    idx = error_index(severity, code)
+    return ERROR_FLAT[idx] if idx >= 0 else None
 
 # Storage locations of data and logs
 FILE_DATA         = const("data.bin")
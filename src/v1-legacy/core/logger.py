@@ -1,66 +1,92 @@
-from core.utils.utils import file_exists, create_bin_file, time_to_bytes, format_time, get_file_size, clear_bin_file, \
+from core.utils.utils import create_bin_file, time_to_bytes, format_time, get_file_size, clear_bin_file, \
     rotate_file, append_bytes
-from core.constants.constants import LOG_LEVELS, FILE_LOG, FILE_LOG_TEMP, FILE_DATA, FILE_DATA_TEMP, LOG_HDR_SOB, LOG_HDR_EOB, DATA_HDR_EDB, DATA_HDR_SDB, DATA_HDR_MDB, domain_to
+from core.constants.constants import LOG_LEVELS, LVL_FATAL, LVL_CRITICAL, LVL_WARN, LVL_INFO, LVL_DEBUG, LVL_FATAL_INT, LVL_CRITICAL_INT, LVL_WARN_INT, LVL_INFO_INT, LVL_DEBUG_INT, FILE_LOG, FILE_LOG_TEMP, FILE_DATA, FILE_DATA_TEMP, LOG_HDR_SOB, LOG_HDR_EOB, DATA_HDR_EDB, DATA_HDR_SDB, DATA_HDR_MDB, domain_to
 #from core.utils.error import ErrorCodes
 from core.utils.queue import QueueManager
 from sys import modules
 from time import time
+from machine import Timer
+from micropython import const
+
+# read size used when copying a leftover temp file into the main file
+_FLUSH_CHUNK = const(512)
 
 
 class Log:
-    def __init__(self, level:bytes=None, bufferSize=8, Max=50, file=True, console=True,error_handling=True):
-        self.level = level if level is not None else LOG_LEVELS["INFO"]
-        self._level_original = level
+    def __init__(self, level:bytes=None, bufferSize=8, Max=50, file=True, console=True,error_handling=True, flush_interval=5000):
+        self._set_level(level if level is not None else LOG_LEVELS["INFO"])
+        self._level_original = self.level
         self.file = file
         self.console = console
         self.error_handling = error_handling
         self.log_msg_overwrite = True
 
         self.queue_manager = QueueManager()
-        self.queue_manager.register("logs", bufferSize, lambda b: append_bytes(FILE_LOG_TEMP, b))
-        self.queue_manager.register("data", bufferSize, lambda b: append_bytes(FILE_DATA_TEMP, b))
+        # entries collect in RAM; a full queue hands its whole batch to _write_batch
+        self.queue_manager.register("logs", bufferSize, lambda b: self._write_batch(FILE_LOG, b))
+        self.queue_manager.register("data", bufferSize, lambda b: self._write_batch(FILE_DATA, b))
 
         self.MAX_FILE_SIZE = Max * 8
         self.init()
 
+        # write out partially filled queues at least every flush_interval ms
+        self._flush_timer = Timer()
+        self._flush_timer.init(period=flush_interval, mode=Timer.PERIODIC, callback=self._periodic_flush)
+
     # -----------------------------------------------------
     # Initialize logging Files
     # -----------------------------------------------------
 
     @staticmethod
     def init():
-        for file in [FILE_LOG, FILE_LOG_TEMP, FILE_DATA, FILE_DATA_TEMP]:
-            if not file_exists(file):
-                create_bin_file(file)
+        for file in (FILE_LOG, FILE_LOG_TEMP, FILE_DATA, FILE_DATA_TEMP):
+            create_bin_file(file)
 
-    @staticmethod
-    def _is_level(level, target):
-        return int.from_bytes(level, "big") <= int.from_bytes(target, "big")
+    def _set_level(self, level:bytes):
+        # level stays a byte constant; _level_int is what the log calls compare against
+        self.level = level
+        self._level_int = level[0]
 
 
 
     def _queue_data(self, data):
         self.queue_manager.put("data", data)
-        self.flush(FILE_DATA, FILE_DATA_TEMP)
 
     def _queue_log(self, log_message):
         self.queue_manager.put("logs", log_message)
-        self.flush(FILE_LOG, FILE_LOG_TEMP)
+
+    def _write_batch(self, name, batch, max_rotations=3):
+        # the batch is already buffered in RAM, so it goes straight to the main file
+        try:
+            append_bytes(name, batch)
+            self._rotate_if_needed(name, max_rotations)
+        except OSError as e:
+            print(f"LOG ERROR: Failed to write data - {e}")
+
+    def _rotate_if_needed(self, name, max_rotations=3):
+        if get_file_size(name) > self.MAX_FILE_SIZE:
+            rotate_file(name, max_rotations)
+            # create a fresh main file to continue loging
+            create_bin_file(name)
+
+    def _periodic_flush(self, timer):
+        self.queue_manager.flush_all()
 
     def cleanup(self):
         self.queue_manager.flush_all()
         self.flush(FILE_DATA, FILE_DATA_TEMP)
         self.flush(FILE_LOG, FILE_LOG_TEMP)
 
-    def _buildLog(self, level:str, domain: str, msg: str,origin:str=None):
-        origin = origin if origin else "<unknown>"
+    def _buildLog(self, level:bytes, level_name:str, domain: str, msg: str,origin:bytes=None):
+        # origin comes in as a bytes literal from the callsite, so it is written out as-is
+        origin = origin if origin else b"<unknown>"
         timestamp = time()
-        log_entry = bytearray()
-        log_entry.extend(LOG_LEVELS[level])
-        log_entry.extend(time_to_bytes(timestamp))
-        log_entry.extend(LOG_HDR_SOB+origin.encode("utf-8","ignore")+LOG_HDR_EOB)
-        log_entry.extend(domain_to(domain,byte=True))
-        log_entry.extend(msg.encode() if msg else b"")
+        domain_b = domain_to(domain, byte=True)
+        msg_b = msg.encode() if msg else b""
+
+        # each entry gets its own buffer: Timer callbacks (e.g. SystemHealth) log too and
+        # may run in the middle of this call, so a shared scratch buffer would be overwritten
+        log_entry = b"".join((level, time_to_bytes(timestamp), LOG_HDR_SOB, origin, LOG_HDR_EOB, domain_b, msg_b))
 
         #if self.error_handling: TODO: implement error handling uncommented due to result in circular import
          #  ErrorCodes.handle(level, domain)
@@ -69,33 +95,32 @@ class Log:
             self._queue_log(log_entry)
 
         if self.console:
-            return self._format(level, timestamp,origin,domain,msg)
+            return self._format(level_name, timestamp,origin,domain,msg)
 
         return ""
 
     @staticmethod
-    def _format(level:str, timestamp:int,origin: (str,str,int) ,domain: str, msg:str):
-        return f"[{level}] {format_time(timestamp)} ( {origin} | {domain} ) {msg}"
+    def _format(level:str, timestamp:int,origin: bytes ,domain: str, msg:str):
+        return f"[{level}] {format_time(timestamp)} ( {origin.decode()} | {domain} ) {msg}"
 
     def flush(self, name, name_temp, max_rotations=3):
-        # Append temp -> main, clear temp, then rotate main if too large.
+        # Append whatever is left in temp -> main, clear temp, then rotate main if too large.
         try:
-            # append temp contents
-            if file_exists(name_temp):
-                with open(name_temp, "rb") as temp_f:
-                    data = temp_f.read()
-                if data:
-                    # append atomically
-                    with open(name, "ab") as main_f:
-                        main_f.write(data)
+            if get_file_size(name_temp):
+                # stream through one small reused buffer so RAM use doesn't grow with the temp file
+                buf = bytearray(_FLUSH_CHUNK)
+                mv = memoryview(buf)
+                with open(name_temp, "rb") as temp_f, open(name, "ab") as main_f:
+                    while True:
+                        n = temp_f.readinto(buf)
+                        if not n:
+                            break
+                        main_f.write(mv[:n])
                 # clear temp file
                 clear_bin_file(name_temp)
 
             # rotate if the file is too large
-            if get_file_size(name) > self.MAX_FILE_SIZE:
-                rotate_file(name, max_rotations)
-                # create a fresh main file to continue loging
-                create_bin_file(name)
+            self._rotate_if_needed(name, max_rotations)
 
         except OSError as e:
             print(f"LOG ERROR: Failed to flush data - {e}")
@@ -103,34 +128,36 @@ class Log:
     # -----------------------------------------------------
     # Public logging Functions
     # -----------------------------------------------------
+    # msg may be a %-style format string followed by its args, e.g.
+    # info(CPU, "CPU load at %.2f%%", load). It is only formatted once the level check has passed.
 
-    def debug(self, domain , msg="",origin:str=None):
-        if self._is_level(self.level, LOG_LEVELS["DEBUG"]):
-            log = self._buildLog("DEBUG", domain, msg,origin)
+    def debug(self, domain, msg="", *args, origin:bytes=None):
+        if self._level_int <= LVL_DEBUG_INT:
+            log = self._buildLog(LVL_DEBUG, "DEBUG", domain, msg % args if args else msg, origin)
             if self.console:
                 print(log)
 
-    def info(self, domain, msg="",origin:str=None):
-        if self._is_level(self.level, LOG_LEVELS["INFO"]):
-            log = self._buildLog("INFO", domain, msg,origin)
+    def info(self, domain, msg="", *args, origin:bytes=None):
+        if self._level_int <= LVL_INFO_INT:
+            log = self._buildLog(LVL_INFO, "INFO", domain, msg % args if args else msg, origin)
             if self.console:
                 print(log)
 
-    def warn(self, domain, msg="",origin:str=None):
-        if self._is_level(self.level, LOG_LEVELS["WARN"]):
-            log = self._buildLog("WARN", domain, msg,origin)
+    def warn(self, domain, msg="", *args, origin:bytes=None):
+        if self._level_int <= LVL_WARN_INT:
+            log = self._buildLog(LVL_WARN, "WARN", domain, msg % args if args else msg, origin)
             if self.console:
                 print(log)
 
-    def error(self, domain, msg="",origin:str=None):
-        if self._is_level(self.level, LOG_LEVELS["ERROR"]):
-            log = self._buildLog("ERROR", domain, msg,origin)
+    def error(self, domain, msg="", *args, origin:bytes=None):
+        if self._level_int <= LVL_CRITICAL_INT:
+            log = self._buildLog(LVL_CRITICAL, "ERROR", domain, msg % args if args else msg, origin)
             if self.console:
                 print(log)
 
-    def fatal(self, domain, msg="",origin:str=None):
-        if self._is_level(self.level, LOG_LEVELS["FATAL"]):
-            log = self._buildLog("FATAL", domain, msg,origin)
+    def fatal(self, domain, msg="", *args, origin:bytes=None):
+        if self._level_int <= LVL_FATAL_INT:
+            log = self._buildLog(LVL_FATAL, "FATAL", domain, msg % args if args else msg, origin)
             if self.console:
                 print(log)
 
@@ -145,15 +172,23 @@ class Log:
     # System Health Control to limit logs if storage is low
     # -----------------------------------------------------
 
+    def _mode_low(self):
+        self._set_level(LVL_WARN)
+        self.log_msg_overwrite = False
+
+    def _mode_medium(self):
+        self._set_level(LVL_WARN)
+
+    def _mode_normal(self):
+        self.log_msg_overwrite = True
+        self._set_level(self._level_original)
+
+    _MODES = {"low": _mode_low, "medium": _mode_medium, "normal": _mode_normal}
+
     def mode(self, mode="normal"):
-        if mode == "low":
-            self.level = LOG_LEVELS["WARN"]
-            self.log_msg_overwrite = False
-        elif mode == "medium":
-            self.level = LOG_LEVELS["WARN"]
-        elif mode == "normal":
-            self.log_msg_overwrite = True
-            self.level = self._level_original
+        handler = self._MODES.get(mode)
+        if handler is not None:
+            handler(self)
 
 
 
@@ -170,6 +205,6 @@ if __name__ == "__main__":
     from core.constants.constants import BOARD_TEMP
     logger_instance = Log()
     logger_instance.mode("low")
-    logger_instance.info(BOARD_TEMP, "This is a test temp is normal",origin="test")
-    logger_instance.error(BOARD_TEMP, "This is a test temp too high",origin="test")
+    logger_instance.info(BOARD_TEMP, "This is a test temp is normal",origin=b"test")
+    logger_instance.error(BOARD_TEMP, "This is a test temp too high",origin=b"test")
 
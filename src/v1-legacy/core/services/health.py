@@ -2,10 +2,18 @@ from core.utils.error import raiseError, get_error_count_since_boot, reset_error
 from core.constants.constants import CPU, BOARD_TEMP, RAM, FLASH_MEM, OVERFLOW, SERVICE_START, SERVICE_STOP, LVL_FATAL, \
     LVL_CRITICAL, LVL_UNKNOWN
 from core.logger import get_logger
-from core.utils.system import BOARD_TEMP, BOARD_RAM_USAGE, BOARD_FLASH_USAGE, BOARD_CPU_LOAD, setCPUFrequency, RESET
+# the sensor read is aliased so it doesn't shadow the BOARD_TEMP log domain imported above
+from core.utils.system import BOARD_TEMP as BOARD_TEMPERATURE, BOARD_RAM_USAGE, BOARD_FLASH_USAGE, BOARD_CPU_LOAD, setCPUFrequency, RESET
 from core.services.servicemanager import service_manager
 from machine import Timer
 
+# While a reading stays in the normal range, a check only re-evaluates its thresholds once
+# it moved at least this far from the one it last acted on. Fault readings are always
+# evaluated, so a lasting fault keeps raising errors and reaches the _error() escalation.
+_TEMP_HYSTERESIS = 0.5     # °C
+_RAM_HYSTERESIS = 1024     # bytes used
+_FLASH_HYSTERESIS = 0.5    # percent used
+
 class SystemHealth:
     def __init__(self,interval,hardware_cooling=False):
         self.hardware_cooling = hardware_cooling
@@ -16,97 +24,126 @@ class SystemHealth:
         self._freq_change = False
         self._ram_change = False
         self._mem_change = False
+        # readings the thresholds were last evaluated against (None -> evaluate on the first tick)
+        self._last_temp = None
+        self._last_cpu_band = None
+        self._last_ram = None
+        self._last_flash = None
+        # resolved once here instead of a get_logger() call per log line on every tick
+        self._log = get_logger()
 
     def _temp(self):
-        temp = BOARD_TEMP()
+        temp = BOARD_TEMPERATURE()
+        last = self._last_temp
+        if (last is not None and not self._temp_change and 0 <= temp <= 30
+                and abs(temp - last) < _TEMP_HYSTERESIS):
+            return
+        self._last_temp = temp
         # TODO: Add hardware cooling
         if temp < 0 :
             if temp < -10:
                 self._temp_change = True
-                raiseError(LVL_FATAL, BOARD_TEMP, f"Temperature too low {temp:.2f}°C")
+                raiseError(LVL_FATAL, BOARD_TEMP, "Temperature too low %.2f°C", temp)
             else:
                 self._temp_change = True
-                raiseError(LVL_CRITICAL, BOARD_TEMP, f"Temperature reaching {temp:.2f}°C")
+                raiseError(LVL_CRITICAL, BOARD_TEMP, "Temperature reaching %.2f°C", temp)
         elif temp > 30:
             if temp > 40:
                 self._temp_change = True
-                raiseError(LVL_FATAL, BOARD_TEMP, f"Temperature too high {temp:.2f}°C")
+                raiseError(LVL_FATAL, BOARD_TEMP, "Temperature too high %.2f°C", temp)
             else:
                 self._temp_change = True
-                raiseError(LVL_CRITICAL, BOARD_TEMP, f"Temperature reaching {temp:.2f}°C")
+                raiseError(LVL_CRITICAL, BOARD_TEMP, "Temperature reaching %.2f°C", temp)
         elif self._temp_change:
             self._temp_change = False
-            raiseError(LVL_UNKNOWN,BOARD_TEMP, f"Temperature normal {temp:.2f}°C")
+            raiseError(LVL_UNKNOWN,BOARD_TEMP, "Temperature normal %.2f°C", temp)
 
     def _cpu(self):
         """Check CPU usage."""
         load = BOARD_CPU_LOAD()
+        # the branches below only depend on which side of 50 / 80 the load is on;
+        # the band is remembered only once a branch has acted on it
+        band = (load > 50) + (load > 80)
+        if band == self._last_cpu_band:
+            return
 
         if load > 80:
-            get_logger().warn(CPU, f"CPU load at {load:.2f}% changing frequency","health.py:46")
+            self._log.warn(CPU, "CPU load at %.2f%% changing frequency", load, origin=b"health.py:71")
             setCPUFrequency("high")
             self._freq_change = True
+            self._last_cpu_band = band
         elif load > 50 and self._freq_change:
             setCPUFrequency("normal")
             self._freq_change = False
+            self._last_cpu_band = band
         elif load < 50 and not self._freq_change:
-            get_logger().info(CPU, f"CPU load at {load:.2f}% changing frequency","health.py:53")
+            self._log.info(CPU, "CPU load at %.2f%% changing frequency", load, origin=b"health.py:80")
             setCPUFrequency("low")
             self._freq_change = True
+            self._last_cpu_band = band
 
     def _ram(self):
         """Check RAM usage."""
         ram_usage, used_ram, total_ram = BOARD_RAM_USAGE()
+        last = self._last_ram
+        if (last is not None and not self._ram_change and ram_usage <= 80
+                and abs(used_ram - last) < _RAM_HYSTERESIS):
+            return
+        self._last_ram = used_ram
 
         if ram_usage > 95:
             self._ram_change = True
             service_manager.mode("low")
-            get_logger().warn(RAM, f"RAM {ram_usage:.2f}% changing to low mode","health.py:64")
+            self._log.warn(RAM, "RAM %.2f%% changing to low mode", ram_usage, origin=b"health.py:97")
         elif ram_usage > 80:
             self._ram_change = True
             service_manager.mode("medium")
-            get_logger().info(RAM, f"RAM {ram_usage:.2f}% changing to medium mode","health.py:68")
+            self._log.info(RAM, "RAM %.2f%% changing to medium mode", ram_usage, origin=b"health.py:101")
         elif self._ram_change:
             self._ram_change = False
             service_manager.mode()
-            get_logger().info(RAM, f"RAM {ram_usage:.2f}% changing to normal mode","health.py:72")
+            self._log.info(RAM, "RAM %.2f%% changing to normal mode", ram_usage, origin=b"health.py:105")
 
     def _mem(self):
         """Check flash memory usage."""
         flash_usage, used_flash, total_flash = BOARD_FLASH_USAGE()
+        last = self._last_flash
+        if (last is not None and not self._mem_change and flash_usage <= 70
+                and abs(flash_usage - last) < _FLASH_HYSTERESIS):
+            return
+        self._last_flash = flash_usage
 
         if flash_usage > 80:
             self._mem_change = True
-            get_logger().mode("low")
-            get_logger().warn(FLASH_MEM, f"Flash {flash_usage:.2f}% changing to low mode","health.py:81")
+            self._log.mode("low")
+            self._log.warn(FLASH_MEM, "Flash %.2f%% changing to low mode", flash_usage, origin=b"health.py:119")
         elif flash_usage > 70:
             self._mem_change = True
-            get_logger().mode("medium")
-            get_logger().info(FLASH_MEM, f"Flash {flash_usage:.2f}% changing to medium mode","health.py:85")
+            self._log.mode("medium")
+            self._log.info(FLASH_MEM, "Flash %.2f%% changing to medium mode", flash_usage, origin=b"health.py:123")
         elif self._mem_change:
             self._mem_change = False
-            get_logger().mode()
-            get_logger().info(FLASH_MEM, f"Flash {flash_usage:.2f}% changing to normal mode","health.py:89")
+            self._log.mode()
+            self._log.info(FLASH_MEM, "Flash %.2f%% changing to normal mode", flash_usage, origin=b"health.py:127")
 
-    @staticmethod
-    def _error():
+    def _error(self):
         error_count = get_error_count_since_boot()
         if not error_count > 0:
             return
 
         if error_count >= 30:
-            get_logger().warn(OVERFLOW, f"Error count limit reached {error_count}, restarting system","health.py:98")
-            get_logger().cleanup()
+            self._log.warn(OVERFLOW, "Error count limit reached %d, restarting system", error_count, origin=b"health.py:135")
+            self._log.cleanup()
             RESET()
 
         elif error_count >= 20:
-            get_logger().info(OVERFLOW, f"Too many unresolved errors {error_count}, resetting services","health.py:103")
+            self._log.info(OVERFLOW, "Too many unresolved errors %d, resetting services", error_count, origin=b"health.py:140")
             service_manager.reset()
             service_manager.startAll()
             reset_error_count_since_boot()
 
         elif error_count >= 10:
-            get_logger().info(OVERFLOW, f"Attention {error_count} unresolved errors, restarting services","health.py:109")
+            self._log.info(OVERFLOW, "Attention %d unresolved errors, restarting services", error_count, origin=b"health.py:146")
             service_manager.restartAll()
             reset_error_count_since_boot()
 
@@ -128,7 +165,7 @@ class SystemHealth:
         self.timer = Timer()
 
         self.timer.init(period=self.interval, mode=Timer.PERIODIC, callback=self._check)
-        get_logger().debug(SERVICE_START, "Health started","health.py:131")
+        self._log.debug(SERVICE_START, "Health started", origin=b"health.py:168")
 
     def stop(self):
         if self._is_running:
@@ -136,7 +173,7 @@ class SystemHealth:
 
             if self.timer:
                 self.timer.deinit()
-                get_logger().debug(SERVICE_STOP, "Health stopped","health.py:136")
+                self._log.debug(SERVICE_STOP, "Health stopped", origin=b"health.py:176")
 
 if __name__ == "__main__":
     try:
@@ -5,30 +5,46 @@ from core.constants.constants import LVL_WARN, PARAMETER
 from core.utils.error import raiseError
 
 
+# Blink interval (ms) per mode, built once at import
+_BLINK_INTERVALS = {
+    "error": 100,            # Very fast blink
+    "power_safe": 50000,     # Long blink
+    "pairing": 500,          # Double blink (handled separately)
+    "idle": 2000,            # Very slow blink
+    "connection_lost": 1000, # Slow blink
+    "processing": 300,       # Medium-fast blink
+}
+
+
+def _gcd(a: int, b: int) -> int:
+    while b:
+        a, b = b, a % b
+    return a
+
+
 class LED:
     def __init__(self, led_pin: str | int = "LED", blink_mode: str = "idle",on_period: float = 0.5, off_period: float = 0.5):
         self.led_pin = machine.Pin(led_pin, machine.Pin.OUT)
         self.blink_mode = blink_mode
+        self._interval = self._get_blink_interval()
         self.is_blinking = False
         self.timer = None
         self.on_period = int(on_period * 1000)   # convert to ms
         self.off_period = int(off_period * 1000) # convert to ms
-        self._led_state = 0  # track state for custom blinking
+        self._led_state = 0  # last value written to the pin, so toggling never reads it back
+        # custom blinking runs on one periodic tick of gcd(on, off) ms and counts ticks
+        self._on_ticks = 1
+        self._off_ticks = 1
+        self._ticks_left = 0
 
     def _get_blink_interval(self):
         """Return the interval for blinking based on the mode."""
-        return {
-            "error": 100,            # Very fast blink
-            "power_safe": 50000,     # Long blink
-            "pairing": 500,          # Double blink (handled separately)
-            "idle": 2000,            # Very slow blink
-            "connection_lost": 1000, # Slow blink
-            "processing": 300,       # Medium-fast blink
-        }.get(self.blink_mode, 1000)  # Default 1s if unknown mode
+        return _BLINK_INTERVALS.get(self.blink_mode, 1000)  # Default 1s if unknown mode
 
     def _toggle_led(self, timer):
         """Toggle LED for normal blinking modes."""
-        self.led_pin.value(not self.led_pin.value())
+        self._led_state ^= 1
+        self.led_pin.value(self._led_state)
 
     def _double_blink(self, timer):
         """Double blink pattern for pairing mode."""
@@ -41,15 +57,14 @@ class LED:
         self.led_pin.value(0)
 
     def _custom_blink(self, timer):
-        """Custom blink with on/off periods."""
-        if self._led_state == 0:
-            self.led_pin.value(1)
-            self._led_state = 1
-            self.timer.init(period=self.on_period, mode=machine.Timer.ONE_SHOT, callback=self._custom_blink)
-        else:
-            self.led_pin.value(0)
-            self._led_state = 0
-            self.timer.init(period=self.off_period, mode=machine.Timer.ONE_SHOT, callback=self._custom_blink)
+        """Custom blink with on/off periods, counted in ticks of the periodic timer."""
+        self._ticks_left -= 1
+        if self._ticks_left > 0:
+            return
+        state = self._led_state ^ 1
+        self.led_pin.value(state)
+        self._led_state = state
+        self._ticks_left = self._on_ticks if state else self._off_ticks
 
     def start(self):
         """Start LED blinking based on mode."""
@@ -61,10 +76,16 @@ class LED:
         if self.blink_mode == "pairing":
             self.timer.init(period=1000, mode=machine.Timer.PERIODIC, callback=self._double_blink)
         elif self.blink_mode == "custom":
+            # the timer is programmed once; toggles just count down ticks
+            tick = _gcd(self.on_period, self.off_period) or 1
+            self._on_ticks = max(1, self.on_period // tick)
+            self._off_ticks = max(1, self.off_period // tick)
             self._led_state = 0
-            self._custom_blink(None)  # start cycle
+            self._ticks_left = 1
+            self._custom_blink(None)  # start cycle: LED on
+            self.timer.init(period=tick, mode=machine.Timer.PERIODIC, callback=self._custom_blink)
         else:
-            self.timer.init(period=self._get_blink_interval(),
+            self.timer.init(period=self._interval,
                             mode=machine.Timer.PERIODIC,
                             callback=self._toggle_led)
 
@@ -75,13 +96,15 @@ class LED:
             if self.timer:
                 self.timer.deinit()
             self.led_pin.value(0)  # Ensure LED is off
+            self._led_state = 0
 
     def set_mode(self, new_mode):
         """Set a new LED blinking mode."""
         if new_mode not in ["error", "pairing", "idle", "connection_lost", "processing", "custom"]:
-            raiseError(LVL_WARN, PARAMETER, f"Invalid LED mode {new_mode}")
+            raiseError(LVL_WARN, PARAMETER, "Invalid LED mode %s", new_mode)
 
         self.stop()
         self.blink_mode = new_mode
+        self._interval = self._get_blink_interval()
         time.sleep_ms(100)  # Short delay for smooth restart
         self.start()
@@ -2,45 +2,122 @@ from core.utils.error import PicoOSError, ErrorCodes
 from core.constants.constants import SERVICE_STOP, SERVICE_START, SERVICE_RESTART
 from core.logger import get_logger
 
+try:
+    import uasyncio as asyncio
+except ImportError:
+    asyncio = None
+
 class ServiceManager:
     def __init__(self):
         """Initialize the service manager."""
         self.services = {}
         self.service_definitions = {}
+        # names whose start() went through, so a repeated startAll() doesn't start them again
+        self._started = set()
 
     def register(self, service_name:str,service_priority:int, service_class,*args):
-        """Register a new service."""
+        """Register a new service. It is only instantiated once it is first started or fetched."""
+        if service_name in self.services:
+            # stop the instance being replaced instead of leaving its timer running
+            self.stop(service_name)
+            del self.services[service_name]
         self.service_definitions[service_name] = (service_class, args, service_priority)
-        self.services[service_name] = service_class(*args)
+
+    def _ensure(self, service_name):
+        """Return the service instance, constructing it from its definition on first use."""
+        service = self.services.get(service_name)
+        if service is None:
+            definition = self.service_definitions.get(service_name)
+            if definition is None:
+                return None
+            service_class, args, _ = definition
+            service = service_class(*args)
+            self.services[service_name] = service
+        return service
 
     def start(self, service_name):
         """Start a specific service by name."""
-        service = self.services.get(service_name)
+        if service_name in self._started:
+            return
+        try:
+            service = self._ensure(service_name)
+        except PicoOSError as e:
+            ErrorCodes.handle(e)
+            return
+        except Exception as e:
+            get_logger().warn(SERVICE_START,str(e), origin=b"servicemanager.py:48")
+            return
         if service and hasattr(service, 'start'):
             try:
                 service.start()
-                get_logger().debug(SERVICE_START,f"{service_name}","servicemanager.py:22")
+                self._started.add(service_name)
+                get_logger().debug(SERVICE_START, service_name, origin=b"servicemanager.py:54")
             except PicoOSError as e:
                 ErrorCodes.handle(e)
             except Exception as e:
-                get_logger().warn(SERVICE_START,str(e),"servicemanager.py:26")
+                get_logger().warn(SERVICE_START,str(e), origin=b"servicemanager.py:58")
+
+    def _tiers(self):
+        """Registered service names grouped by priority, highest priority first."""
+        tiers = {}
+        for service_name, (_, _, priority) in self.service_definitions.items():
+            tier = tiers.get(priority)
+            if tier is None:
+                tiers[priority] = [service_name]
+            else:
+                tier.append(service_name)
+        return [tiers[p] for p in sorted(tiers, reverse=True)]
 
     def startAll(self):
-        """Start all registered services."""
-        for service_name, service in self.services.items():
+        """Start all registered services, highest priority first."""
+        for tier in self._tiers():
+            for service_name in tier:
+                self.start(service_name)
+
+    async def start_async(self, service_name):
+        """Start a service, awaiting its astart() if it has one, else like start()."""
+        if service_name in self._started:
+            return
+        try:
+            service = self._ensure(service_name)
+        except Exception:
+            service = None  # start() below reports the construction error
+        astart = getattr(service, 'astart', None)
+        if astart is None:
             self.start(service_name)
+            return
+        try:
+            await astart()
+            self._started.add(service_name)
+            get_logger().debug(SERVICE_START, service_name, origin=b"servicemanager.py:92")
+        except PicoOSError as e:
+            ErrorCodes.handle(e)
+        except Exception as e:
+            get_logger().warn(SERVICE_START,str(e), origin=b"servicemanager.py:96")
+
+    async def startAll_async(self):
+        """
+        Start all registered services one priority tier at a time; the services
+        within a tier start concurrently. Falls back to startAll() without uasyncio.
+        """
+        if asyncio is None:
+            self.startAll()
+            return
+        for tier in self._tiers():
+            await asyncio.gather(*[self.start_async(n) for n in tier])
 
     def stop(self, service_name):
         """Stop a specific service by name."""
+        self._started.discard(service_name)
         service = self.services.get(service_name)
         if service and hasattr(service, 'stop'):
             try:
                 service.stop()
-                get_logger().debug(SERVICE_STOP, f"{service_name}","servicemanager.py:39")
+                get_logger().debug(SERVICE_STOP, service_name, origin=b"servicemanager.py:116")
             except PicoOSError as e:
                 ErrorCodes.handle(e)
             except Exception as e:
-                get_logger().warn(SERVICE_STOP, str(e),"servicemanager.py:43")
+                get_logger().warn(SERVICE_STOP, str(e), origin=b"servicemanager.py:120")
 
     def stop_exclude(self, service_names:list[str]):
         """Stop all registered services except the ones in the list."""
@@ -49,9 +126,34 @@ class ServiceManager:
                 self.stop(service_name)
 
     def stopAll(self):
-        """Stop all registered services."""
-        for service_name, service in self.services.items():
+        """Stop all registered services, lowest priority first."""
+        for tier in reversed(self._tiers()):
+            for service_name in tier:
+                self.stop(service_name)
+
+    async def stop_async(self, service_name):
+        """Stop a service, awaiting its astop() if it has one, else like stop()."""
+        service = self.services.get(service_name)
+        astop = getattr(service, 'astop', None)
+        if astop is None:
             self.stop(service_name)
+            return
+        self._started.discard(service_name)
+        try:
+            await astop()
+            get_logger().debug(SERVICE_STOP, service_name, origin=b"servicemanager.py:144")
+        except PicoOSError as e:
+            ErrorCodes.handle(e)
+        except Exception as e:
+            get_logger().warn(SERVICE_STOP, str(e), origin=b"servicemanager.py:148")
+
+    async def stopAll_async(self):
+        """Stop all registered services one priority tier at a time, lowest first."""
+        if asyncio is None:
+            self.stopAll()
+            return
+        for tier in reversed(self._tiers()):
+            await asyncio.gather(*[self.stop_async(n) for n in tier])
 
     def restart(self, service_name):
         """Restart a specific service by name."""
@@ -62,39 +164,37 @@ class ServiceManager:
         """Restart all registered services."""
         self.stopAll()
         self.startAll()
-        get_logger().info(SERVICE_RESTART,"All services restarted","servicemanager.py:65")
+        get_logger().info(SERVICE_RESTART,"All services restarted", origin=b"servicemanager.py:167")
+
+    async def restartAll_async(self):
+        """Restart all registered services tier by tier (see startAll_async)."""
+        await self.stopAll_async()
+        await self.startAll_async()
+        get_logger().info(SERVICE_RESTART,"All services restarted", origin=b"servicemanager.py:173")
 
     def reset(self):
         """Reset all services by reinitializing them."""
         self.stopAll()
         try:
+            # startAll() rebuilds each instance from its definition as it starts it
             self.services.clear()
-            for service_name, (service_class, args, _) in self.service_definitions.items():
-                self.services[service_name] = service_class(*args)
-
             self.startAll()  # Start services after reinitialization
 
         except PicoOSError as e:
             ErrorCodes.handle(e)
         except Exception as e:
-            get_logger().warn(SERVICE_RESTART, str(e),"servicemanager.py:80")
+            get_logger().warn(SERVICE_RESTART, str(e), origin=b"servicemanager.py:186")
 
     def reset_exclude(self, service_names: list[str]):
-        self.stop_exclude(service_names)
-        try:
-            temp_services = {name: self.services[name] for name in service_names if name in self.services}
-            self.services.clear()
-
-            for service_name, (service_class, args, _) in self.service_definitions.items():
-                if service_name not in service_names:
-                    self.services[service_name] = service_class(*args)
-
-            self.services.update(temp_services)  # Restore excluded services
-            self.startAll()
-        except PicoOSError as e:
-            ErrorCodes.handle(e)
-        except Exception as e:
-            get_logger().warn(SERVICE_RESTART, str(e),"servicemanager.py:97")
+        """Reset all services except the ones in the list by reinitializing them."""
+        for service_name in self.service_definitions:
+            if service_name in service_names:
+                continue
+            self.stop(service_name)
+            # dropped in place; startAll() rebuilds it from its definition
+            self.services.pop(service_name, None)
+        # excluded services that are still running are skipped there
+        self.startAll()
 
     def get_priority(self, service_name):
         return self.service_definitions[service_name][2]
@@ -105,21 +205,29 @@ class ServiceManager:
             if self.get_priority(service_name) < priority:
                 self.stop(service_name)
 
+    def _mode_low(self):
+        self._stop_unnecessary_services(3)
+
+    def _mode_medium(self):
+        self._stop_unnecessary_services(2)
+
+    def _mode_normal(self):
+        self.startAll()
+
+    _MODES = {"low": _mode_low, "medium": _mode_medium, "normal": _mode_normal}
+
     def mode(self,mode="normal"):
         """Set the mode of the service manager.
 
         Args:
             mode (str): The mode to set. Can be "low", "medium", or "normal".
         """
-        if mode == "low":
-            self._stop_unnecessary_services(3)
-        elif mode == "medium":
-            self._stop_unnecessary_services(2)
-        elif mode == "normal":
-            self.startAll()
+        handler = self._MODES.get(mode)
+        if handler is not None:
+            handler(self)
 
     def get(self, service_name):
         """Get a specific service by name."""
-        return self.services.get(service_name)
+        return self._ensure(service_name)
 
 service_manager = ServiceManager()
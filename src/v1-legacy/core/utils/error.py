@@ -1,5 +1,12 @@
-from core.constants.constants import ERROR_TABLE, LOG_LEVELS, domain_to
-from core.logger import get_logger
+from core.constants.constants import ERROR_FLAT, LOG_LEVELS, error_index
+
+# Logger used by raiseError/ErrorCodes, set by bootinit.init() once the logger exists
+_log = None
+
+def set_logger(log):
+    """Set the logger used for error reporting (called from bootinit.init())."""
+    global _log
+    _log = log
 
 # Error count since boot
 error_count_since_boot = 0
@@ -28,55 +35,70 @@ def reset_error_count_since_boot():
     global error_count_since_boot
     error_count_since_boot = 0
 
-def raiseError(level: bytes, domain:int , message: str = ""):
-    error = PicoOSError(level, domain, message)
+def raiseError(level: bytes, domain:int , message: str = "", *args):
+    """
+    Raise a PicoOSError. message may be a %-style format string with args; it is only
+    formatted when the error is actually handled or logged.
+    """
     if level >= LOG_LEVELS["CRITICAL"]:
-        ErrorCodes.handle(error)
+        ErrorCodes.handle(PicoOSError(level, domain, message, *args))
     else:
-        get_logger().info(domain_to(domain), message,"error.py:36")
+        _log.info(domain, message, *args, origin=b"error.py:46")
 
 
 
 class PicoOSError(Exception):
-    """Base class for PicoOS errors."""
-    def __init__(self, level:bytes, domain:int, message:str=""):
+    """
+    Base class for PicoOS errors. message may be a %-style format string with args;
+    it is only formatted when .message or str() is actually used.
+    """
+    def __init__(self, level:bytes, domain:int, message:str="", *args):
         self.level = level  # First byte: severity
+        self.level_int = level[0]
         self.domain = domain
-        self.message = message
+        self._message = message
+        self._message_args = args
         super().__init__(message)
 
+    @property
+    def message(self):
+        args = self._message_args
+        return self._message % args if args else self._message
+
     def __str__(self):
-        return f"PicoOSError(level=0x{self.level:02X}, domain=0x{self.domain:02X}): {self.message}"
+        return "PicoOSError(level=0x%02X, domain=%s): %s" % (self.level_int, self.domain, self.message)
 
 
 class ErrorCodes:
-    _table = ERROR_TABLE
+    _table = ERROR_FLAT
 
     @classmethod
     def register(cls,name: str, domain: int, level: int, resolver, auto_resolve=True):
-        cls._table[domain][level] = (name, resolver, auto_resolve)
+        idx = error_index(level, domain)
+        if idx < 0:
+            raise ValueError("Unknown error domain")
+        cls._table[idx] = (name, resolver, auto_resolve)
 
     @classmethod
     def get(cls, level, domain):
         """
         Retrieve error details based on both severity and code.
         """
-        if domain in cls._table and level in cls._table[domain]:
-            return cls._table[domain][level]  # Return specific level match
-        return None
+        idx = error_index(level, domain)
+        return cls._table[idx] if idx >= 0 else None
 
     @classmethod
     def handle(cls, error: PicoOSError):
         entry = cls.get(error.level, error.domain)
         if not entry:
-            get_logger().error(error.domain, error.message,"error.py:72")
+            _log.error(error.domain, error._message, *error._message_args, origin=b"error.py:94")
             increment_error_count_since_boot()  # Increment because it's an unknown error
             return False
 
         name, resolver, auto_resolve = entry
 
-        log_func = get_logger().error if error.level >= LOG_LEVELS["CRITICAL"] else get_logger().info
-        log_func(error.domain, f"{name}: {error.message}","error.py:79")
+        log_func = _log.error if error.level >= LOG_LEVELS["CRITICAL"] else _log.info
+        log_func(error.domain, "%s: %s", name, error.message, origin=b"error.py:101")
 
         if error.level >= LOG_LEVELS["CRITICAL"] and not auto_resolve:
             increment_error_count_since_boot()  # Only increment for unresolved errors
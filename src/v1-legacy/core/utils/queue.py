@@ -2,11 +2,16 @@
 # MicroPython-friendly ByteQueue + QueueManager
 # Avoids typing & loging modules so it works on boot
 
-# NOTE: flush_cb will be called with a bytes object when the queue is flushed.
+# NOTE: flush_cb is called with a bytes copy of the queued data when the queue is flushed.
 # Keep flush_cb small and fast (no heavy I/O inside if possible).
+# Only the cursor work (append, detaching a batch) runs with IRQs disabled: the logger's
+# periodic flush Timer and Timer-driven loggers (SystemHealth) touch the same queue.
+# flush_cb itself always runs with IRQs enabled.
+
+from machine import disable_irq, enable_irq
 
 class ByteQueue:
-    def __init__(self, max_size=64, flush_cb=None, flush_trigger_size=None):
+    def __init__(self, max_size=64, flush_cb=None, flush_trigger_size=None, safe_flush=False):
         # normalize/validate sizes
         if max_size is None:
             max_size = 64
@@ -27,8 +32,12 @@ class ByteQueue:
             except Exception:
                 self.flush_trigger_size = self.max_size
 
-        self.buffer = bytearray()
+        # allocated once; _len is the fill cursor, a flush just rewinds it
+        self.buffer = bytearray(self.max_size)
+        self._mv = memoryview(self.buffer)
+        self._len = 0
         self.flush_cb = flush_cb
+        self.safe_flush = safe_flush  # kept for callers; batches are always detached copies now
 
     def put(self, data):
         # accept bytes, bytearray or str
@@ -37,63 +46,79 @@ class ByteQueue:
                 data = data.encode("utf-8")
             except Exception:
                 data = bytes(data)
-        elif isinstance(data, bytearray):
-            data = bytes(data)
-        elif not isinstance(data, (bytes, bytearray)):
-            raise TypeError("ByteQueue.put expects bytes/bytearray/str")
+        elif not isinstance(data, (bytes, bytearray, memoryview)):
+            raise TypeError("ByteQueue.put expects bytes/bytearray/memoryview/str")
 
         data_len = len(data)
-        buf_len = len(self.buffer)
 
         # if single chunk bigger than max_size: flush and raise
         if data_len > self.max_size:
             # try to flush existing buffer
-            if self.flush_cb and buf_len:
-                try:
-                    self.flush_cb(bytes(self.buffer))
-                except Exception:
-                    # swallow callback exceptions to avoid crashing the system at logger time
-                    pass
-                self.buffer = bytearray()
+            self.flush()
             raise ValueError("Data too large for queue (size {})".format(data_len))
 
-        # if adding would overflow, flush existing buffer first
-        if buf_len + data_len > self.max_size:
-            if self.flush_cb and buf_len:
-                try:
-                    self.flush_cb(bytes(self.buffer))
-                except Exception:
-                    pass
-                self.buffer = bytearray()
+        full = ready = None
+        irq = disable_irq()
+        try:
+            # if adding would overflow, detach the existing buffer first
+            if self._len + data_len > self.max_size:
+                full = self._detach()
 
-        # append
-        self.buffer.extend(data)
+            # append
+            n = self._len
+            self._mv[n:n + data_len] = data
+            self._len = n + data_len
 
-        # auto-flush when threshold reached
-        if self.flush_trigger_size is not None and len(self.buffer) >= self.flush_trigger_size:
-            self.flush()
+            # auto-flush when threshold reached
+            if self.flush_trigger_size is not None and self._len >= self.flush_trigger_size:
+                ready = self._detach()
+        finally:
+            enable_irq(irq)
+
+        # the file I/O happens with IRQs enabled again
+        self._emit(full)
+        self._emit(ready)
 
     def flush(self):
-        if self.flush_cb and self.buffer:
+        irq = disable_irq()
+        try:
+            batch = self._detach()
+        finally:
+            enable_irq(irq)
+        self._emit(batch)
+
+    def _detach(self):
+        # caller holds IRQs disabled: copy the batch out and rewind, nothing else
+        n = self._len
+        self._len = 0
+        return bytes(self._mv[:n]) if n else None
+
+    def _emit(self, batch):
+        if batch is not None and self.flush_cb:
             try:
-                self.flush_cb(bytes(self.buffer))
+                self.flush_cb(batch)
             except Exception:
                 # swallow exceptions from callback to keep logger robust on device
                 pass
-        self.buffer = bytearray()
 
     def clear(self):
-        self.buffer = bytearray()
+        irq = disable_irq()
+        self._len = 0
+        enable_irq(irq)
+
+    def __len__(self):
+        return self._len
 
 
 class QueueManager:
     def __init__(self):
         self.queues = {}
 
-    def register(self, name, max_size=64, flush_cb=None, flush_trigger_size=None):
+    def register(self, name, max_size=64, flush_cb=None, flush_trigger_size=None, safe_flush=False):
         if not isinstance(name, str) or not name:
             raise ValueError("Queue name must be a non-empty string")
-        q = ByteQueue(max_size=max_size, flush_cb=flush_cb, flush_trigger_size=flush_trigger_size)
+        q = ByteQueue(max_size=max_size, flush_cb=flush_cb, flush_trigger_size=flush_trigger_size,
+                      safe_flush=safe_flush)
         self.queues[name] = q
 
     def put(self, name, data):
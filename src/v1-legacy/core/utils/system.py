@@ -1,7 +1,19 @@
 from machine import ADC, freq , reset , soft_reset
 from gc import collect, mem_free, mem_alloc
 from os import statvfs
-from time import ticks_ms, ticks_us
+from time import ticks_ms, ticks_us, ticks_diff, sleep_ms
+
+# CPU frequency (Hz) per setCPUFrequency() mode
+_FREQS = {
+    "max": 200_000_000,
+    "high": 133_000_000,
+    "low": 80_000_000,
+    "normal": 125_000_000,
+}
+
+# last BOARD_STATS() result and the ticks_ms() it was taken at
+_STATS_TTL_MS = 1000
+_stats_cache = {"ts": 0, "val": None}
 
 
 def BOARD_TEMP():
@@ -9,16 +21,20 @@ def BOARD_TEMP():
     return 27 - (ADC(4).read_u16() * 3.3 / 65535 - 0.706) / 0.001721
 
 
-def BOARD_RAM_USAGE():
+def BOARD_RAM_USAGE(gc_collect: bool = True):
     """
     Get the RAM usage of the device.
 
+    :param gc_collect: Run gc.collect() first so garbage is not counted as used.
+                       Pass False for a cheaper, less accurate reading.
+
     Returns a tuple of three values:
         - usage_percent (float): The percentage of RAM used.
         - used_ram (int): The amount of RAM used in bytes.
         - total_ram (int): The total amount of RAM in bytes.
     """
-    collect()
+    if gc_collect:
+        collect()
     used_ram = mem_alloc()
     free_ram = mem_free()
     total_ram = used_ram + free_ram
@@ -44,29 +60,45 @@ def BOARD_FLASH_USAGE():
 
 
 def BOARD_CPU_LOAD(duration_ms: int = 100):
-    """Get the estimated CPU load of the device in percentage."""
-    start_time = ticks_ms()
-    busy_time = 0
-    end_time = start_time + duration_ms
-
-    while ticks_ms() < end_time:
-        busy_start = ticks_us()
-        while ticks_us() - busy_start < 10:  # Keep the CPU busy for 10µs
-            pass
-        busy_time += 10  # Increment busy time
+    """
+    Get the estimated CPU load of the device in percentage.
 
-    cpu_load = (busy_time / (duration_ms * 1000)) * 100  # Convert to percentage
-    return cpu_load
+    Sleeps in 1 ms slices for duration_ms and measures how late they wake up:
+    time taken by interrupt handlers and other work shows up as drift, while the
+    CPU itself idles during the sleeps instead of being kept busy.
+    """
+    slices = duration_ms if duration_ms > 0 else 1
+    start = ticks_us()
+    for _ in range(slices):
+        sleep_ms(1)
+    actual_us = ticks_diff(ticks_us(), start)
+    expected_us = slices * 1000
+    if actual_us <= expected_us:
+        return 0.0
+    return (1 - expected_us / actual_us) * 100  # Convert to percentage
+
+
+def BOARD_STATS(force: bool = False):
+    """
+    Get the stats of the device.
 
+    The result is cached for _STATS_TTL_MS, since a fresh reading costs a gc.collect(),
+    a statvfs() call, an ADC read and a CPU load sample.
 
-def BOARD_STATS():
-    """Get the stats of the device."""
-    return {
+    :param force: Take a fresh reading even if the cached one is still valid.
+    """
+    now = ticks_ms()
+    if not force and _stats_cache["val"] is not None and ticks_diff(now, _stats_cache["ts"]) < _STATS_TTL_MS:
+        return _stats_cache["val"]
+    stats = {
         "temp": BOARD_TEMP(),
         "ram_usage": BOARD_RAM_USAGE(),
         "flash_usage": BOARD_FLASH_USAGE(),
         "cpu_load": BOARD_CPU_LOAD()
     }
+    _stats_cache["ts"] = ticks_ms()
+    _stats_cache["val"] = stats
+    return stats
 
 
 def setCPUFrequency(mode: str = "normal"):
@@ -76,14 +108,7 @@ def setCPUFrequency(mode: str = "normal"):
     :param:
         mode (str): The mode to set the CPU frequency to. Can be "max", "high", "low", or "normal".
     """
-    if mode == "max":
-        freq(200_000_000)
-    elif mode == "high":
-        freq(133_000_000)
-    elif mode == "low":
-        freq(80_000_000)
-    else:  # Default to "normal" if mode is unknown
-        freq(125_000_000)
+    freq(_FREQS.get(mode, 125_000_000))  # default to "normal" if mode is unknown
 
 def RESET(soft:bool = False):
     """Resets the device."""
@@ -31,7 +31,10 @@ def create_bin_file(path: str) -> None:
     """
     Create the file if it doesn't exist. IMPORTANT: this will NOT truncate an existing file.
     """
-    if not file_exists(path):
+    # only a missing file raises here, so the usual already-exists case costs one stat
+    try:
+        stat(path)
+    except OSError:
         # open in append mode and close immediately — creates file but won't overwrite existing file
         with open(path, "ab") as f:
             pass
@@ -61,11 +64,10 @@ def rotate_file(path: str, max_rotations: int = 3) -> None:
     """
     Rotate path -> path.1 -> path.2 ... up to max_rotations. Removes oldest if needed.
     """
-    # remove oldest
+    # remove oldest; remove/rename already raise OSError on a missing file, so no stat beforehand
     oldest = "{}.{}".format(path, max_rotations)
     try:
-        if file_exists(oldest):
-            remove(oldest)
+        remove(oldest)
     except OSError:
         pass
 
@@ -74,14 +76,12 @@ def rotate_file(path: str, max_rotations: int = 3) -> None:
         src = "{}.{}".format(path, i)
         dst = "{}.{}".format(path, i + 1)
         try:
-            if file_exists(src):
-                rename(src, dst)
+            rename(src, dst)
         except OSError:
             pass
 
     # rotate main to .1
     try:
-        if file_exists(path):
-            rename(path, "{}.1".format(path))
+        rename(path, "{}.1".format(path))
     except OSError:
         pass
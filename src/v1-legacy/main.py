@@ -45,4 +45,4 @@ if __name__ == "__main__":
     # Register service with 0.2 min interval (~12s)
     service_manager.register("Weather_Station", 1, Weather_Station, 5)
     service_manager.startAll()
-    get_logger().warn(SERVICE_START,"Weather_Station", "Main.py:40")
+    get_logger().warn(SERVICE_START,"Weather_Station", origin=b"Main.py:40")
@@ -9,8 +9,10 @@ import ustruct as struct
 # Mesh
 
 # Header: version, type, src, dst, seq, ttl, flags, plen
-BASE_HEADER_FORMAT_NO_CRC = "<BBHHHBBB"  # 9 bytes
-BASE_HEADER_SIZE_NO_CRC = struct.calcsize(BASE_HEADER_FORMAT_NO_CRC)
+BASE_HEADER_FORMAT_NO_CRC = "<BBHHHBBB"
+BASE_HEADER_SIZE_NO_CRC = const(11)  # struct.calcsize(BASE_HEADER_FORMAT_NO_CRC)
+# keeps the baked size honest; compiled away with mpy-cross -O
+assert struct.calcsize(BASE_HEADER_FORMAT_NO_CRC) == BASE_HEADER_SIZE_NO_CRC
 CRC8_SIZE = const(1)
 MESH_VERSION = const(3)
 MAX_NEIGHBORS = const(32)
@@ -51,7 +53,7 @@ MESH_FLAG_FILE = const(1 << 7)
 # -------------------------------------------------------------------
 DEFAULT_TTL = const(10)  # Default Time To Live (hops)
 # Max payload bytes (fits header)
-MAX_PAYLOAD_SIZE = ESPNOW_MAX_PAYLOAD_SIZE - (BASE_HEADER_SIZE_NO_CRC + CRC8_SIZE)
+MAX_PAYLOAD_SIZE = const(ESPNOW_MAX_PAYLOAD_SIZE - (BASE_HEADER_SIZE_NO_CRC + CRC8_SIZE))
 BROADCAST_ADDR = const(0xFFFF)
 UNDEFINED_NODE_ID = const(0x0000)  # For uninitialized nodes
 FILE_RX_WINDOW_SIZE = const(10)
@@ -62,6 +64,7 @@ BROADCAST_ADDR_MAC: bytes = b"\xff\xff\xff\xff\xff\xff"
 # -------------------------------------------------------------------
 MESH_BACKGROUND_LISTENER_INTERVAL = const(1)
 MESH_BACKGROUND_PRIORITY = const(3)
+MESH_RX_DRAIN_MAX = const(8)  # buffered packets handled per receive wake-up before yielding
 MESH_CLEAN_INTERVAL = const(10_000)
 MESH_HELLO_INTERVAL = const(30_000)
 ESPNOW_WIFI_CHANNEL = const(6)  # balanced 1 has best range but might be to crowded
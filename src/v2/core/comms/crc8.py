@@ -2,15 +2,21 @@
 Fast, compact CRC-8 (poly=0x07) for MicroPython
 Table-based default (256 bytes table) -> best perf.
 Optional table-less mode available for extremely low RAM.
+The table loop is compiled with @micropython.viper where the port supports it.
 """
 
+try:
+    import micropython
+except ImportError:
+    micropython = None
+
 _DEFAULT_POLY = 0x07
 _DEFAULT_INIT = 0x00
 
 
 def _make_table(poly: int = _DEFAULT_POLY) -> bytearray:
     """
-    Table generation (fast; done once on import)
+    Table generation for custom polynomials (the default table is precomputed below)
     :param poly:
     :return:
     """
@@ -26,45 +32,189 @@ def _make_table(poly: int = _DEFAULT_POLY) -> bytearray:
     return t
 
 
-# Precompute table (occupies ~256 bytes RAM) - recommended.
-_TABLE = _make_table(_DEFAULT_POLY)
+# Default-poly table, precomputed as _make_table(_DEFAULT_POLY) - recommended.
+# A bytes literal stays in flash on MicroPython instead of taking 256 bytes of RAM.
+_TABLE = (
+    b"\x00\x07\x0e\x09\x1c\x1b\x12\x15\x38\x3f\x36\x31\x24\x23\x2a\x2d"
+    b"\x70\x77\x7e\x79\x6c\x6b\x62\x65\x48\x4f\x46\x41\x54\x53\x5a\x5d"
+    b"\xe0\xe7\xee\xe9\xfc\xfb\xf2\xf5\xd8\xdf\xd6\xd1\xc4\xc3\xca\xcd"
+    b"\x90\x97\x9e\x99\x8c\x8b\x82\x85\xa8\xaf\xa6\xa1\xb4\xb3\xba\xbd"
+    b"\xc7\xc0\xc9\xce\xdb\xdc\xd5\xd2\xff\xf8\xf1\xf6\xe3\xe4\xed\xea"
+    b"\xb7\xb0\xb9\xbe\xab\xac\xa5\xa2\x8f\x88\x81\x86\x93\x94\x9d\x9a"
+    b"\x27\x20\x29\x2e\x3b\x3c\x35\x32\x1f\x18\x11\x16\x03\x04\x0d\x0a"
+    b"\x57\x50\x59\x5e\x4b\x4c\x45\x42\x6f\x68\x61\x66\x73\x74\x7d\x7a"
+    b"\x89\x8e\x87\x80\x95\x92\x9b\x9c\xb1\xb6\xbf\xb8\xad\xaa\xa3\xa4"
+    b"\xf9\xfe\xf7\xf0\xe5\xe2\xeb\xec\xc1\xc6\xcf\xc8\xdd\xda\xd3\xd4"
+    b"\x69\x6e\x67\x60\x75\x72\x7b\x7c\x51\x56\x5f\x58\x4d\x4a\x43\x44"
+    b"\x19\x1e\x17\x10\x05\x02\x0b\x0c\x21\x26\x2f\x28\x3d\x3a\x33\x34"
+    b"\x4e\x49\x40\x47\x52\x55\x5c\x5b\x76\x71\x78\x7f\x6a\x6d\x64\x63"
+    b"\x3e\x39\x30\x37\x22\x25\x2c\x2b\x06\x01\x08\x0f\x1a\x1d\x14\x13"
+    b"\xae\xa9\xa0\xa7\xb2\xb5\xbc\xbb\x96\x91\x98\x9f\x8a\x8d\x84\x83"
+    b"\xde\xd9\xd0\xd7\xc2\xc5\xcc\xcb\xe6\xe1\xe8\xef\xfa\xfd\xf4\xf3"
+)
+
+# Slice-by-4 for the default table: four input bytes per loop step, for another 768 bytes of flash.
+# CRC8 is linear, so [a, b, c, d] from state s gives
+# _TABLE4[s ^ a] ^ _TABLE3[b] ^ _TABLE2[c] ^ _TABLE[d],
+# where _TABLEk[i] is the CRC of i followed by k - 1 zero bytes from state 0
+# (i.e. _TABLE2[i] = _TABLE[_TABLE[i]], _TABLE3[i] = _TABLE[_TABLE2[i]], ...).
+USE_SLICING = True
+_TABLE2 = (
+    b"\x00\x15\x2a\x3f\x54\x41\x7e\x6b\xa8\xbd\x82\x97\xfc\xe9\xd6\xc3"
+    b"\x57\x42\x7d\x68\x03\x16\x29\x3c\xff\xea\xd5\xc0\xab\xbe\x81\x94"
+    b"\xae\xbb\x84\x91\xfa\xef\xd0\xc5\x06\x13\x2c\x39\x52\x47\x78\x6d"
+    b"\xf9\xec\xd3\xc6\xad\xb8\x87\x92\x51\x44\x7b\x6e\x05\x10\x2f\x3a"
+    b"\x5b\x4e\x71\x64\x0f\x1a\x25\x30\xf3\xe6\xd9\xcc\xa7\xb2\x8d\x98"
+    b"\x0c\x19\x26\x33\x58\x4d\x72\x67\xa4\xb1\x8e\x9b\xf0\xe5\xda\xcf"
+    b"\xf5\xe0\xdf\xca\xa1\xb4\x8b\x9e\x5d\x48\x77\x62\x09\x1c\x23\x36"
+    b"\xa2\xb7\x88\x9d\xf6\xe3\xdc\xc9\x0a\x1f\x20\x35\x5e\x4b\x74\x61"
+    b"\xb6\xa3\x9c\x89\xe2\xf7\xc8\xdd\x1e\x0b\x34\x21\x4a\x5f\x60\x75"
+    b"\xe1\xf4\xcb\xde\xb5\xa0\x9f\x8a\x49\x5c\x63\x76\x1d\x08\x37\x22"
+    b"\x18\x0d\x32\x27\x4c\x59\x66\x73\xb0\xa5\x9a\x8f\xe4\xf1\xce\xdb"
+    b"\x4f\x5a\x65\x70\x1b\x0e\x31\x24\xe7\xf2\xcd\xd8\xb3\xa6\x99\x8c"
+    b"\xed\xf8\xc7\xd2\xb9\xac\x93\x86\x45\x50\x6f\x7a\x11\x04\x3b\x2e"
+    b"\xba\xaf\x90\x85\xee\xfb\xc4\xd1\x12\x07\x38\x2d\x46\x53\x6c\x79"
+    b"\x43\x56\x69\x7c\x17\x02\x3d\x28\xeb\xfe\xc1\xd4\xbf\xaa\x95\x80"
+    b"\x14\x01\x3e\x2b\x40\x55\x6a\x7f\xbc\xa9\x96\x83\xe8\xfd\xc2\xd7"
+) if USE_SLICING else None
+_TABLE3 = (
+    b"\x00\x6b\xd6\xbd\xab\xc0\x7d\x16\x51\x3a\x87\xec\xfa\x91\x2c\x47"
+    b"\xa2\xc9\x74\x1f\x09\x62\xdf\xb4\xf3\x98\x25\x4e\x58\x33\x8e\xe5"
+    b"\x43\x28\x95\xfe\xe8\x83\x3e\x55\x12\x79\xc4\xaf\xb9\xd2\x6f\x04"
+    b"\xe1\x8a\x37\x5c\x4a\x21\x9c\xf7\xb0\xdb\x66\x0d\x1b\x70\xcd\xa6"
+    b"\x86\xed\x50\x3b\x2d\x46\xfb\x90\xd7\xbc\x01\x6a\x7c\x17\xaa\xc1"
+    b"\x24\x4f\xf2\x99\x8f\xe4\x59\x32\x75\x1e\xa3\xc8\xde\xb5\x08\x63"
+    b"\xc5\xae\x13\x78\x6e\x05\xb8\xd3\x94\xff\x42\x29\x3f\x54\xe9\x82"
+    b"\x67\x0c\xb1\xda\xcc\xa7\x1a\x71\x36\x5d\xe0\x8b\x9d\xf6\x4b\x20"
+    b"\x0b\x60\xdd\xb6\xa0\xcb\x76\x1d\x5a\x31\x8c\xe7\xf1\x9a\x27\x4c"
+    b"\xa9\xc2\x7f\x14\x02\x69\xd4\xbf\xf8\x93\x2e\x45\x53\x38\x85\xee"
+    b"\x48\x23\x9e\xf5\xe3\x88\x35\x5e\x19\x72\xcf\xa4\xb2\xd9\x64\x0f"
+    b"\xea\x81\x3c\x57\x41\x2a\x97\xfc\xbb\xd0\x6d\x06\x10\x7b\xc6\xad"
+    b"\x8d\xe6\x5b\x30\x26\x4d\xf0\x9b\xdc\xb7\x0a\x61\x77\x1c\xa1\xca"
+    b"\x2f\x44\xf9\x92\x84\xef\x52\x39\x7e\x15\xa8\xc3\xd5\xbe\x03\x68"
+    b"\xce\xa5\x18\x73\x65\x0e\xb3\xd8\x9f\xf4\x49\x22\x34\x5f\xe2\x89"
+    b"\x6c\x07\xba\xd1\xc7\xac\x11\x7a\x3d\x56\xeb\x80\x96\xfd\x40\x2b"
+) if USE_SLICING else None
+_TABLE4 = (
+    b"\x00\x16\x2c\x3a\x58\x4e\x74\x62\xb0\xa6\x9c\x8a\xe8\xfe\xc4\xd2"
+    b"\x67\x71\x4b\x5d\x3f\x29\x13\x05\xd7\xc1\xfb\xed\x8f\x99\xa3\xb5"
+    b"\xce\xd8\xe2\xf4\x96\x80\xba\xac\x7e\x68\x52\x44\x26\x30\x0a\x1c"
+    b"\xa9\xbf\x85\x93\xf1\xe7\xdd\xcb\x19\x0f\x35\x23\x41\x57\x6d\x7b"
+    b"\x9b\x8d\xb7\xa1\xc3\xd5\xef\xf9\x2b\x3d\x07\x11\x73\x65\x5f\x49"
+    b"\xfc\xea\xd0\xc6\xa4\xb2\x88\x9e\x4c\x5a\x60\x76\x14\x02\x38\x2e"
+    b"\x55\x43\x79\x6f\x0d\x1b\x21\x37\xe5\xf3\xc9\xdf\xbd\xab\x91\x87"
+    b"\x32\x24\x1e\x08\x6a\x7c\x46\x50\x82\x94\xae\xb8\xda\xcc\xf6\xe0"
+    b"\x31\x27\x1d\x0b\x69\x7f\x45\x53\x81\x97\xad\xbb\xd9\xcf\xf5\xe3"
+    b"\x56\x40\x7a\x6c\x0e\x18\x22\x34\xe6\xf0\xca\xdc\xbe\xa8\x92\x84"
+    b"\xff\xe9\xd3\xc5\xa7\xb1\x8b\x9d\x4f\x59\x63\x75\x17\x01\x3b\x2d"
+    b"\x98\x8e\xb4\xa2\xc0\xd6\xec\xfa\x28\x3e\x04\x12\x70\x66\x5c\x4a"
+    b"\xaa\xbc\x86\x90\xf2\xe4\xde\xc8\x1a\x0c\x36\x20\x42\x54\x6e\x78"
+    b"\xcd\xdb\xe1\xf7\x95\x83\xb9\xaf\x7d\x6b\x51\x47\x25\x33\x09\x1f"
+    b"\x64\x72\x48\x5e\x3c\x2a\x10\x06\xd4\xc2\xf8\xee\x8c\x9a\xa0\xb6"
+    b"\x03\x15\x2f\x39\x5b\x4d\x77\x61\xb3\xa5\x9f\x89\xeb\xfd\xc7\xd1"
+) if USE_SLICING else None
+
+
+if micropython is not None and hasattr(micropython, "viper"):
+
+    @micropython.viper
+    def _crc8_table(crc: int, data: ptr8, length: int, table: ptr8) -> int:
+        """Table loop as native code: no bytecode dispatch per byte."""
+        for i in range(length):
+            crc = int(table[crc ^ int(data[i])])
+        return crc
+
+    @micropython.viper
+    def _crc8_sliced(crc: int, data: ptr8, length: int) -> int:
+        """Slice-by-4 loop over the default tables as native code."""
+        t1 = ptr8(_TABLE)
+        t2 = ptr8(_TABLE2)
+        t3 = ptr8(_TABLE3)
+        t4 = ptr8(_TABLE4)
+        i = 0
+        end = length - 3
+        while i < end:
+            crc = (int(t4[crc ^ int(data[i])]) ^ int(t3[data[i + 1]])
+                   ^ int(t2[data[i + 2]]) ^ int(t1[data[i + 3]]))
+            i += 4
+        while i < length:
+            crc = int(t1[crc ^ int(data[i])])
+            i += 1
+        return crc
+
+    @micropython.viper
+    def _crc8_bitwise(crc: int, data: ptr8, length: int, poly: int) -> int:
+        """Table-less loop as native code, the 8 bit steps unrolled and branchless."""
+        for i in range(length):
+            crc ^= int(data[i])
+            # poly & -(top bit) is poly when the top bit is set, else 0
+            crc = ((crc << 1) ^ (poly & -(crc >> 7))) & 0xFF
+            crc = ((crc << 1) ^ (poly & -(crc >> 7))) & 0xFF
+            crc = ((crc << 1) ^ (poly & -(crc >> 7))) & 0xFF
+            crc = ((crc << 1) ^ (poly & -(crc >> 7))) & 0xFF
+            crc = ((crc << 1) ^ (poly & -(crc >> 7))) & 0xFF
+            crc = ((crc << 1) ^ (poly & -(crc >> 7))) & 0xFF
+            crc = ((crc << 1) ^ (poly & -(crc >> 7))) & 0xFF
+            crc = ((crc << 1) ^ (poly & -(crc >> 7))) & 0xFF
+        return crc
+
+else:
+
+    def _crc8_table(crc: int, data, length: int, table) -> int:
+        """Table loop, pure Python fallback (CPython or ports without viper)."""
+        # bytes, bytearray and memoryview all iterate/index as ints: no memoryview wrapper needed
+        for b in data:
+            crc = table[crc ^ b]
+        return crc
+
+    def _crc8_sliced(crc: int, data, length: int) -> int:
+        """Slice-by-4 loop over the default tables, pure Python fallback."""
+        t1 = _TABLE
+        t2 = _TABLE2
+        t3 = _TABLE3
+        t4 = _TABLE4
+        tail = length & ~3
+        for i in range(0, tail, 4):
+            crc = t4[crc ^ data[i]] ^ t3[data[i + 1]] ^ t2[data[i + 2]] ^ t1[data[i + 3]]
+        for i in range(tail, length):
+            crc = t1[crc ^ data[i]]
+        return crc
+
+    def _crc8_bitwise(crc: int, data, length: int, poly: int) -> int:
+        """Table-less loop, pure Python fallback."""
+        for b in data:
+            crc ^= b
+            for _ in range(8):
+                if crc & 0x80:
+                    crc = ((crc << 1) ^ poly) & 0xFF
+                else:
+                    crc = (crc << 1) & 0xFF
+        return crc
 
 
 def crc8(
     data: bytes | bytearray | memoryview,
     init: int = _DEFAULT_INIT,
-    table: bytearray = _TABLE,
+    table: bytes | bytearray = _TABLE,
 ):
     """
     Compute CRC8 over bytes-like `data`.
-    `data` can be bytes, bytearray, memoryview, or list/tuple of ints.
+    `data` can be bytes, bytearray or memoryview.
     Returns int 0..255.
     """
-    crc = init & 0xFF
-    # memoryview avoids extra allocations and is fast in MicroPython
-    if isinstance(data, memoryview):
-        mv = data
-    else:
-        mv = memoryview(data)
-
-    tbl = table
-    for b in mv:
-        # XOR then table lookup
-        crc = tbl[crc ^ b]
-    return crc
+    if USE_SLICING and table is _TABLE:
+        return _crc8_sliced(init & 0xFF, data, len(data))
+    return _crc8_table(init & 0xFF, data, len(data), table)
 
 
-def crc8_update(crc: int, data: bytes | bytearray, table: bytearray = _TABLE) -> int:
+def crc8_update(crc: int, data: bytes | bytearray, table: bytes | bytearray = _TABLE) -> int:
     """
     Continue CRC8 with existing `crc` value.
     Returns updated crc.
     """
-    crc &= 0xFF
-    mv = memoryview(data)
-    tbl = table
-    for b in mv:
-        crc = tbl[crc ^ b]
-    return crc
+    if USE_SLICING and table is _TABLE:
+        return _crc8_sliced(crc & 0xFF, data, len(data))
+    return _crc8_table(crc & 0xFF, data, len(data), table)
 
 
 # --- Table-less (bitwise) fallback for extremely low RAM ---
@@ -75,16 +225,7 @@ def crc8_nontable(
     CRC-8 without table. Much less RAM, slower CPU.
     Use when you cannot afford the 256-byte table.
     """
-    crc = init & 0xFF
-    mv = memoryview(data)
-    for b in mv:
-        crc ^= b
-        for _ in range(8):
-            if crc & 0x80:
-                crc = ((crc << 1) ^ poly) & 0xFF
-            else:
-                crc = (crc << 1) & 0xFF
-    return crc
+    return _crc8_bitwise(init & 0xFF, data, len(data), poly & 0xFF)
 
 
 # --- Class API (streaming) ---
@@ -141,23 +282,15 @@ class CRC8:
         Update CRC8 with new data.
         :param data:
         """
-        if self._use_table:
-            tbl = self._table
-            crc = self._crc
-            for b in memoryview(data):
-                crc = tbl[crc ^ b]
-            self._crc = crc
+        # one slot load each; the table is None exactly when use_table is off
+        crc = self._crc & 0xFF
+        table = self._table
+        if table is None:
+            self._crc = _crc8_bitwise(crc, data, len(data), self._poly)
+        elif USE_SLICING and table is _TABLE:
+            self._crc = _crc8_sliced(crc, data, len(data))
         else:
-            crc = self._crc
-            poly = self._poly
-            for b in memoryview(data):
-                crc ^= b
-                for _ in range(8):
-                    if crc & 0x80:
-                        crc = ((crc << 1) ^ poly) & 0xFF
-                    else:
-                        crc = (crc << 1) & 0xFF
-            self._crc = crc
+            self._crc = _crc8_table(crc, data, len(data), table)
 
     def digest(self) -> int:
         """
@@ -186,12 +319,30 @@ class CRC8:
 def append_crc8_to_bytes(buf: bytes | bytearray) -> bytes:
     """
     Returns a new bytes object = buf + crc8(buf).
-    (Convenient for short headers.)
+    (Convenient for short headers; packet builders use append_crc8_into instead.)
     :param buf:
-    :return:
+    :return: bytes of len(buf) + 1
     """
-    c = crc8(buf)
-    return bytes(buf) + bytes([c])
+    n = len(buf)
+    out = bytearray(n + 1)
+    out[:n] = buf
+    out[n] = crc8(buf)
+    return bytes(out)
+
+
+def append_crc8_into(out: bytearray, start: int, length: int) -> int:
+    """
+    Computes crc8 over out[start:start + length] and writes it to out[start + length].
+    Lets packet builders fill a preallocated buffer without an intermediate copy.
+    :param out: Buffer with room for the CRC byte
+    :param start: Offset of the covered data
+    :param length: Number of covered bytes
+    :return: The written crc
+    """
+    end = start + length
+    c = crc8(memoryview(out)[start:end])
+    out[end] = c
+    return c
 
 
 def append_crc8_to_bytearray(buf: bytearray) -> int:
@@ -211,10 +362,12 @@ def verify_crc8(data_with_crc: bytes | bytearray | memoryview) -> bool:
     :param data_with_crc:
     :return:
     """
-    if len(data_with_crc) < 1:
+    n = len(data_with_crc) - 1
+    if n < 0:
         return False
-    mv = memoryview(data_with_crc)
-    # last byte:
-    expected = mv[-1]
-    crc = crc8(mv[:-1])
-    return crc == expected
+    if USE_SLICING:
+        # the kernel takes an explicit length: no view or slice of the frame needed
+        return _crc8_sliced(_DEFAULT_INIT, data_with_crc, n) == data_with_crc[n]
+    # sliced below, so wrap only if the caller didn't already pass a view
+    mv = data_with_crc if isinstance(data_with_crc, memoryview) else memoryview(data_with_crc)
+    return crc8(mv[:n]) == mv[n]
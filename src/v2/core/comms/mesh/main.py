@@ -37,6 +37,7 @@ from core.comms.constants import (
     MESH_FLAG_FILE,
     FILE_RX_WINDOW_SIZE,
     MESH_TYPE_ACK,
+    MESH_RX_DRAIN_MAX,
 )
 from core.constants import MESH_SECRET, MESH_GATEWAY, EVENT_MESH_FILE_RECEIVED
 from core.queue import RingBuffer
@@ -46,6 +47,7 @@ from core.config import get_config
 from core.util import _file_exists, deprecated
 from core.comms.mesh.packets import (
     build_packet,
+    set_packet_seq,
     parse_packet,
     chunk_packet,
     chunk_file,
@@ -67,6 +69,15 @@ NAME = 5
 SIZE = 6
 
 
+def _node_id_from(mac: bytes | bytearray) -> int:
+    """Node id encoded in the last two bytes of a MAC address."""
+    return (mac[4] << 8) | mac[5]
+
+
+# (suffix, ms factor) for string timeouts; "ms" must be tried before "s"
+_TIMEOUT_SUFFIXES = (("ms", 1), ("s", 1000), ("min", 60_000), ("h", 3_600_000))
+
+
 class Mesh:  # pylint: disable=too-many-instance-attributes
     """
     PicoCore V2 Comms Mesh Main Class
@@ -89,7 +100,7 @@ class Mesh:  # pylint: disable=too-many-instance-attributes
         self._esp: AIOESPNow | None = None
         self._neighbors = {}  # TODO: Maybe add fixed leng dict with * MAX_NEIGHBORS
         self._peers = RingBuffer(MAX_NEIGHBORS, True)
-        self._neighbor_index = {}  # {node_id: index}+
+        self._peer_set = set()  # O(1) membership for _add(); mirrors _peers
         self._receiving = False
         self._rx_enabled = False
         self._rx_expected_until = 0  # ticks_ms timestamp
@@ -113,6 +124,8 @@ class Mesh:  # pylint: disable=too-many-instance-attributes
         self._seen_queue = RingBuffer(self._seen_limit + 1)
 
         self._gateway = bool(cfg.get(MESH_GATEWAY)) if not None else False
+        # hello packet built on first use; later hellos only patch seq + CRC8
+        self._hello_tpl = None
 
     # Helper section ---------------------------------------------------------
 
@@ -161,21 +174,16 @@ class Mesh:  # pylint: disable=too-many-instance-attributes
         if timeout is None:
             return -1
 
-        if isinstance(timeout, str):
-            timeout = timeout.lower().strip()
-
-            if timeout.endswith("ms"):
-                return int(timeout[:-2])
-            if timeout.endswith("s"):
-                return int(timeout[:-1]) * 1000
-            if timeout.endswith("min"):
-                return int(timeout[:-3]) * 1000 * 60
-            if timeout.endswith("h"):
-                return int(timeout[:-1]) * 1000 * 60 * 60
+        # numeric fast path: no string handling at all
+        if not isinstance(timeout, str):
+            return int(timeout * 1000)
 
-            raise ValueError("Invalid timeout format")
+        timeout = timeout.lower().strip()
+        for suffix, factor in _TIMEOUT_SUFFIXES:
+            if timeout.endswith(suffix):
+                return int(timeout[: -len(suffix)]) * factor
 
-        return int(timeout * 1000)
+        raise ValueError("Invalid timeout format")
 
     # TODO add proper clean logic also fo partial messages and optimize.
     def _clean_fragment_buffers(self, now):
@@ -214,7 +222,8 @@ class Mesh:  # pylint: disable=too-many-instance-attributes
     #
     # Data structures:
     #
-    # - neighbor entry -> node_id : tuple (node_id, mac, version, seq, ts, rssi, gateway)
+    # - neighbor entry -> node_id : list [node_id, mac, version, seq, ts, rssi, gateway]
+    #   (a list, so a refresh from the same neighbor is written in place)
     # - route entry -> node_id : node_id, score
     # TODO: Remove routes dict solution as it implies to much RAM usage. Rely on previous neighbor table by introducing none atomic data structure.
     #  Meaning the indirect neighbors only store a quality score and which direct neighbor to use to get to it.
@@ -323,11 +332,16 @@ class Mesh:  # pylint: disable=too-many-instance-attributes
         """
         return node_id in self._neighbors
 
-    def _update_neighbor(self, node_id: int, entry) -> None:
+    @staticmethod
+    def _update_neighbor(entry: list, version: int, seq: int, ts: int, rssi: int, gateway: bool) -> None: # pylint: disable=too-many-arguments,too-many-positional-arguments
         """
-        Update a neighbor entry.
+        Refresh a direct neighbor entry in place (node_id and mac never change).
         """
-        self._neighbors[node_id] = entry
+        entry[2] = version
+        entry[3] = seq
+        entry[4] = ts
+        entry[5] = rssi
+        entry[6] = gateway
 
     def _cleanup_neighbors(self):
         now = time.ticks_ms()
@@ -353,9 +367,19 @@ class Mesh:  # pylint: disable=too-many-instance-attributes
         :param mac:
         :return:
         """
-        if mac not in self._peers:
-            self._peers.put(mac)
-            self._esp.add_peer(mac)
+        # bytearray is unhashable and must match an equal bytes key
+        key = mac if isinstance(mac, bytes) else bytes(mac)
+        peer_set = self._peer_set
+        if key in peer_set:
+            return
+
+        peers = self._peers
+        if peers.is_full():
+            # the ring overwrites its oldest peer; keep the set in step
+            peer_set.discard(peers.peek())
+        peers.put(key)
+        peer_set.add(key)
+        self._esp.add_peer(key)
 
     def _peer(self, peer: int | bytes) -> tuple[int, bytes]:
         """
@@ -380,7 +404,7 @@ class Mesh:  # pylint: disable=too-many-instance-attributes
             return node_id, mac
 
         if self.is_mac(peer):
-            return self.node_id(peer), bytes(peer)
+            return _node_id_from(peer), bytes(peer)
 
         raise ValueError(
             f"Invalid peer: {peer} | type: {type(peer)} "
@@ -394,11 +418,10 @@ class Mesh:  # pylint: disable=too-many-instance-attributes
         :return:  The node id as int
         """
         if mac is not None:
-            return (mac[4] << 8) | mac[5]
+            return _node_id_from(mac)
 
         if self._node_id is UNDEFINED_NODE_ID:
-            mac = self._wlan.config("mac")
-            self._node_id = (mac[4] << 8) | mac[5]
+            self._node_id = _node_id_from(self._wlan.config("mac"))
 
         return self._node_id
 
@@ -427,12 +450,14 @@ class Mesh:  # pylint: disable=too-many-instance-attributes
         :return:
         """
         rssi, ts = self.get_rssi(host)
+        entry = self._neighbors.get(src)
 
-        if not self._is_neighbor(src):
-            self._add_neighbor(src, (src, host, version, seq, ts, rssi, gateway))
+        # unknown, or only known through an indirect route so far
+        if entry is None or len(entry) != 7:
+            self._add_neighbor(src, [src, host, version, seq, ts, rssi, gateway])
 
         else:
-            self._update_neighbor(src, (src, host, version, seq, ts, rssi, gateway))
+            self._update_neighbor(entry, version, seq, ts, rssi, gateway)
 
         self._cleanup_neighbors()
 
@@ -569,7 +594,8 @@ class Mesh:  # pylint: disable=too-many-instance-attributes
             return  # Return on dropped packages when runtime assertions don't apply -> ex. protocol version
         _version, _ptype, _src, _dst, _seq, _ttl, _flags, _plen, _payload = parsed
 
-        my_id = self.node_id()
+        # resolved by start(), which the receive loops run before any packet arrives
+        my_id = self._node_id
 
         logger().debug(f"RX packet dst={_dst}, me={my_id}")
 
@@ -809,8 +835,14 @@ class Mesh:  # pylint: disable=too-many-instance-attributes
         # Increment sequence number
         self._up_sequence()
 
+        tpl = self._hello_tpl
+        if tpl is not None:
+            # everything but the sequence number is constant for this node
+            set_packet_seq(tpl, self._sequence)
+            return tpl, BROADCAST_ADDR_MAC
+
         # Build hello packet
-        return build_packet(
+        tpl = self._hello_tpl = build_packet(
             MESH_TYPE_HELLO,
             self.node_id(),
             BROADCAST_ADDR,
@@ -819,7 +851,8 @@ class Mesh:  # pylint: disable=too-many-instance-attributes
             MESH_FLAG_BCAST | MESH_FLAG_ACK,
             b"",
             self._gateway,
-        ), BROADCAST_ADDR_MAC
+        )
+        return tpl, BROADCAST_ADDR_MAC
 
     def hello(self) -> None:
         """
@@ -854,7 +887,7 @@ class Mesh:  # pylint: disable=too-many-instance-attributes
         return (
             MESH_TYPE_HELLO_ACK,
             self.node_id(),
-            self.node_id(mac),
+            _node_id_from(mac),
             self._sequence,
             self._ttl,
             0,
@@ -1312,6 +1345,8 @@ class Mesh:  # pylint: disable=too-many-instance-attributes
             self.start()
 
         _airecv = self._esp.airecv
+        _any = self._esp.any
+        _irq = self._irq
         _sleep_ms = asyncio.sleep_ms
 
         while True:
@@ -1320,7 +1355,16 @@ class Mesh:  # pylint: disable=too-many-instance-attributes
                 try:
                     host, msg = await _airecv()
                     if host and msg:
-                        await self._irq(host, msg)
+                        await _irq(host, msg)
+
+                    # drain packets already buffered without a sleep per packet,
+                    # bounded so a burst cannot starve the other tasks
+                    n = MESH_RX_DRAIN_MAX
+                    while n and _any():
+                        host, msg = await _airecv()
+                        if host and msg:
+                            await _irq(host, msg)
+                        n -= 1
                 except asyncio.TimeoutError:
                     pass
                 except Exception as e:
@@ -1410,6 +1454,7 @@ class Mesh:  # pylint: disable=too-many-instance-attributes
         _ticks_ms = time.ticks_ms
         _sleep_ms = asyncio.sleep_ms
         _airecv = self._esp.airecv
+        _irq = self._irq
         _async_hello = self.async_hello
         _clean_neighbors = self._cleanup_neighbors
         _clean_fragments = self._clean_fragment_buffers
@@ -1429,7 +1474,7 @@ class Mesh:  # pylint: disable=too-many-instance-attributes
                 try:
                     host, msg = await _airecv()
                     if host and msg:
-                        await self._irq(host, msg)
+                        await _irq(host, msg)
                 except asyncio.TimeoutError:
                     pass
                 except Exception as e:
@@ -5,6 +5,7 @@ This module provides utility functions for the PicoCore V2 Comms Mesh module.
 """
 
 import micropython
+from micropython import const
 import os
 
 import ustruct as struct
@@ -21,7 +22,10 @@ from core.comms.constants import (
     MESH_FLAG_GATEWAY,
     MESH_FLAG_FILE,
 )
-from core.comms.crc8 import append_crc8_to_bytearray, verify_crc8
+from core.comms.crc8 import append_crc8_into, verify_crc8
+
+# byte offset of seq in the header: version, type, src, dst come first
+_SEQ_OFFSET = const(6)
 
 
 def payload_conv(payload: str | bytes | bytearray):
@@ -85,21 +89,34 @@ def build_packet(
     if gateway:
         flags |= MESH_FLAG_GATEWAY
 
+    # One buffer for the whole packet: header, CRC8, payload
+    header_len = BASE_HEADER_SIZE_NO_CRC
+    packet = bytearray(header_len + 1 + _plen)
+
     # Pack header
-    header = bytearray(
-        struct.pack(
-            BASE_HEADER_FORMAT_NO_CRC, version, ptype, src, dst, seq, ttl, flags, _plen
-        )
+    struct.pack_into(
+        BASE_HEADER_FORMAT_NO_CRC, packet, 0, version, ptype, src, dst, seq, ttl, flags, _plen
     )
 
-    # Append CRC8 of header
-    append_crc8_to_bytearray(header)
+    # CRC8 of header, right behind it
+    append_crc8_into(packet, 0, header_len)
 
-    # append payload
-    header.extend(payload)
+    # copy payload
+    packet[header_len + 1 :] = payload
 
     # Return final packet
-    return header
+    return packet
+
+
+def set_packet_seq(packet: bytearray, seq: int) -> None:
+    """
+    Rewrite the sequence number of a built packet in place and refresh its header CRC8.
+    Lets a sender reuse a prebuilt packet whose other fields never change.
+    :param packet: Packet as returned by build_packet
+    :param seq: Sequence number (0-65535)
+    """
+    struct.pack_into("<H", packet, _SEQ_OFFSET, seq)
+    append_crc8_into(packet, 0, BASE_HEADER_SIZE_NO_CRC)
 
 
 @micropython.native
@@ -43,6 +43,7 @@ LOGGER_MAX_FILE_SIZE = const("system.logger.max_file_size")
 LOGGER_CONSOLE = const("system.logger.log_to_console")
 LOGGER_FILE_LOG = const("system.logger.log_to_file")
 LOGGER_MAX_ROTATIONS = const("system.logger.max_rotations")
+LOGGER_CONSOLE_BUFFERED = const("system.logger.console_buffered")
 
 MESH_ENABLED = const("comms.mesh.enabled")
 MESH_SECRET = const("comms.mesh.secret")
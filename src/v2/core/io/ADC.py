@@ -5,6 +5,7 @@ This class provides a simple interface to the machines ADC (Analog-to-Digital Co
 """
 
 from time import sleep
+from array import array
 import math
 from math import isnan
 from machine import ADC as HWADC, Pin
@@ -244,6 +245,8 @@ class VoltageDivider(ADC):
         super().__init__(adc_pin, vref, scale, offset)
         self.r1 = r1
         self.r2 = r2
+        # raw sample buffer for async_mean_real_voltage, allocated on first use
+        self._sample_buf = None
 
     def real_voltage(self) -> float:
         """
@@ -255,9 +258,29 @@ class VoltageDivider(ADC):
         print("rvol", v)
         return v
 
-    async def async_mean_real_voltage(self, n: int = 10, delay: float = 0.001) -> float:
-        """Return average real voltage of n samples."""
-        readings = await self.async_samples(n, "voltage", delay)
-        avg_raw = sum(readings) / len(readings)
-        v = avg_raw * (self.r1 + self.r2) / self.r2
-        return v
+    async def async_mean_real_voltage(self, n: int = 10, delay: float = 0.001, burst: int = 8) -> float:
+        """
+        Return average real voltage of n samples.
+
+        The raw samples are read back-to-back in bursts of `burst` into a reused
+        u16 array, yielding to the scheduler once per burst instead of once per
+        sample. The sampling window (about n * delay seconds) stays the same.
+
+        :param n: Number of samples to average
+        :param delay: Delay per sample in seconds, spread over the bursts
+        :param burst: Number of samples read between two yields
+        :return: Real voltage
+        """
+        buf = self._sample_buf
+        if buf is None or len(buf) != n:
+            buf = self._sample_buf = array("H", bytes(2 * n))
+
+        read = self._pin.read_u16
+        pause = n * delay / ((n + burst - 1) // burst)
+        for i in range(0, n, burst):
+            for j in range(i, min(i + burst, n)):
+                buf[j] = read()
+            await async_sleep(pause)
+
+        avg_raw = sum(buf) / n
+        return (avg_raw / 65535) * self._vref * (self.r1 + self.r2) / self.r2
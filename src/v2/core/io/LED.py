@@ -18,55 +18,59 @@ class Led:
         :param args: Arguments for the Pin class (e.g. Pin.OUT).
         """
         self.pin = Pin(pin,*args)
+        # bound Pin.value, cached so the hot paths skip the attribute lookups
+        self._v = self.pin.value
 
     def on(self):
         """
         Turn on the LED.
         :return:
         """
-        self.pin.value(1)
+        self._v(1)
 
     def off(self):
         """
         Turn off the LED.
         :return:
         """
-        self.pin.value(0)
+        self._v(0)
 
     def toggle(self):
         """
         Toggle the LED.
         :return:
         """
-        self.pin.value(not self.pin.value())
+        v = self._v
+        v(v() ^ 1)
 
     def state(self):
         """
         Return the state of the LED.
         :return:
         """
-        return self.pin.value()
+        return self._v()
 
     async def async_on(self):
         """
         Turn on the LED.
         :return:
         """
-        self.pin.value(1)
+        self._v(1)
 
     async def async_off(self):
         """
         Turn off the LED.
         :return:
         """
-        self.pin.value(0)
+        self._v(0)
 
     async def async_toggle(self):
         """
         Toggle the LED.
         :return:
         """
-        self.pin.value(not self.pin.value())
+        v = self._v
+        v(v() ^ 1)
 
     async def async_blink(self,n:int, delay: float):
         """
@@ -76,5 +80,5 @@ class Led:
         :return:
         """
         for _ in range(n):
-            await self.async_toggle()
+            self.toggle()
             await asyncio.sleep(delay)
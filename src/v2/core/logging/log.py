@@ -12,7 +12,9 @@ Usage:
 """
 
 import os
+import sys
 import ustruct
+from time import ticks_ms
 
 from core.constants import (
     TRACE,
@@ -24,19 +26,21 @@ from core.constants import (
     LEVEL_NAMES,
     LOG_FILE_PATH,
     DATA_FILE_PATH,
-    LEVEL_BYTES,
     LOGGER_LEVEL,
     LOGGER_BUFFER_SIZE,
     LOGGER_MAX_FILE_SIZE,
     LOGGER_CONSOLE,
     LOGGER_FILE_LOG,
     LOGGER_MAX_ROTATIONS,
+    LOGGER_CONSOLE_BUFFERED,
     LEVEL_NAMES_REV,
 )
 from core.config import get_config
 
-from core.util import _file_exists, uptime, create_file
-from core.queue import RingBuffer, ByteRingBuffer
+from core.util import get_file_size
+
+# " | NAME | " per level, built once so a console line is a single 4-part join
+_LEVEL_SEP = {lvl: " | " + name + " | " for lvl, name in LEVEL_NAMES.items()}
 
 
 class Logger:
@@ -48,6 +52,7 @@ class Logger:
         console: bool = True,
         file_log: bool = True,
         max_rotations: int = 3,
+        console_buffered: bool = False,
     ):
         """
         Logger class for logging messages to console and file.As well as application data entries.
@@ -57,6 +62,7 @@ class Logger:
         :param console: Weather logs should be printed to console
         :param file_log: Weather logs should be written to file
         :param max_rotations: The maximum number of log- / datafiles before the oldest is deleted
+        :param console_buffered: Collect console lines and print them in one write per flush_console() instead of one print per log
         :return:
         """
         self.level = level
@@ -65,22 +71,44 @@ class Logger:
         self.file_log = file_log
         self.max_bytes = self._parse_size(max_file_size)
         self.max_rotations = max_rotations
+        self.console_buffered = console_buffered
 
         # runtime
         self._orig_level = self.level
-        self._log_buf = ByteRingBuffer(self.buffer_size * 45)
-        self._data_buf = RingBuffer(self.buffer_size, True)
+        # encoded lines are appended to these and written out once they reach
+        # _flush_trigger_bytes; clearing keeps the bytearray's capacity for reuse
+        self._flush_trigger_bytes = self.buffer_size * 45
+        self._log_buf = bytearray()
+        self._data_buf = bytearray()
+        self._console_buf = bytearray()
+        # hard cap for the pending log lines, reached only when flushes keep failing
+        # (e.g. a full filesystem); lines past it are counted and dropped
+        self._max_queue_bytes = max(20 * 1024, self._flush_trigger_bytes)
+        self._dropped = 0
 
         self.log_path = LOG_FILE_PATH
         self.data_path = DATA_FILE_PATH
+        # append handles stay open between flushes; closed on rotation and close()
+        self._log_fh = None
+        self._data_fh = None
         self._file_checks()
+        # bytes in the current files, counted on write so flushes don't need a stat
+        self._log_bytes = get_file_size(self.log_path) or 0
+        self._data_bytes = get_file_size(self.data_path) or 0
+        # set by a flush that crossed max_bytes; rotate_pending() does the renames later
+        self._log_rotate_pending = False
+        self._data_rotate_pending = False
 
     def _file_checks(self) -> None:
         """
-        Check if the log file exists and create it if it doesn't.
+        Create the log file if it doesn't exist.
+        Opening the append handle does that without a separate existence probe.
         """
-        if not _file_exists(self.log_path) and self.file_log:
-            create_file(self.log_path)
+        if self.file_log:
+            try:
+                self._get_fh(self.log_path, "_log_fh")
+            except OSError as e:
+                print("[LOGGER] _file_checks OSError:", e)
 
     @staticmethod
     def _parse_size(size: str | int) -> int:
@@ -107,7 +135,8 @@ class Logger:
         Get the current time in milliseconds.
         :return:
         """
-        return uptime(ms=True)
+        # same value as uptime(ms=True), without its keyword/branch handling per log call
+        return ticks_ms()
 
     @staticmethod
     def _format_timestamp(t: int) -> str:
@@ -131,10 +160,8 @@ class Logger:
         :param msg:
         :return:
         """
-        lvl = LEVEL_BYTES.get(level_int)
-        t = ustruct.pack("<I", t)
-        msg = msg.encode("utf-8")
-        return lvl + t + msg
+        # level byte + little-endian uint32 timestamp packed in one call
+        return ustruct.pack("<BI", level_int, t) + msg.encode("utf-8")
 
     def _format_line(self, t: int, level_int: int, msg: str) -> str:
         """
@@ -144,9 +171,8 @@ class Logger:
         :param msg:
         :return:
         """
-        lvl = LEVEL_NAMES.get(level_int)
-        t = self._format_timestamp(t)
-        return f"{t} | {lvl} | {msg} \n"
+        # join instead of an f-string: MicroPython compiles f-strings to str.format()
+        return "".join((self._format_timestamp(t), _LEVEL_SEP[level_int], msg, " \n"))
 
     def _enqueue_log(self, level_int, msg):
         """
@@ -161,14 +187,20 @@ class Logger:
 
         if self.console:
             line = self._format_line(t, level_int, msg)
-            print(line.rstrip("\n"))
+            if self.console_buffered:
+                self._console_buf.extend(line.encode("utf-8"))
+            else:
+                print(line, end="")
 
         if self.file_log:
+            if len(self._log_buf) >= self._max_queue_bytes:
+                self._dropped += 1
+                return
             line_b = self._format_line_bin(t, level_int, msg)
-            self._log_buf.put(line_b)
+            self._log_buf.extend(line_b)
 
             # flush immediate if buffer full
-            if self._log_buf.is_full():
+            if len(self._log_buf) >= self._flush_trigger_bytes:
                 self._flush_logs()
 
     def _enqueue_data(self, name, data_str):
@@ -177,76 +209,157 @@ class Logger:
         :param name:
         :param data_str:
         """
-        line = f"{self._timestamp()},{name},{data_str}\n"
-        self._data_buf.put(line)
-        if self._data_buf.is_full():
+        # encoded once here so a flush is a single write of the buffer
+        line = f"{self._timestamp()},{name},{data_str}\n".encode("utf-8")
+        self._data_buf.extend(line)
+        if len(self._data_buf) >= self._flush_trigger_bytes:
             self._flush_data()
 
+    def _get_fh(self, path: str, attr: str):
+        """
+        Return the open append handle stored in attr, opening path ("ab") on first use.
+        Opening in append mode also creates a missing file.
+        """
+        fh = getattr(self, attr)
+        if fh is None:
+            fh = open(path, "ab")
+            setattr(self, attr, fh)
+        return fh
+
+    def _close_fh(self, attr: str) -> None:
+        """Close and forget the handle stored in attr, if any."""
+        fh = getattr(self, attr)
+        if fh is not None:
+            setattr(self, attr, None)
+            try:
+                fh.close()
+            except OSError:
+                pass
+
+    def flush_console(self) -> None:
+        """Print the buffered console lines with a single stdout write (console_buffered only)."""
+        if not self._console_buf:
+            return
+        sys.stdout.write(self._console_buf)
+        self._console_buf[:] = b""
+
     def _flush_logs(self):
         """Write buffered log lines to disk and rotate if needed. Small-chunk write only."""
-        if not _file_exists(self.log_path):
-            create_file(self.log_path)
+        # warn/error/fatal flush right away, so their console lines shouldn't wait either
+        self.flush_console()
+
+        dropped = self._dropped
+        # one summary line after the lines that were queued before the drops
+        summary = (
+            self._format_line_bin(self._timestamp(), WARN, f"{dropped} log messages dropped")
+            if dropped else None
+        )
 
-        if self._log_buf.is_empty():
+        if not self._log_buf and summary is None:
             return
 
         try:
-            with open(self.log_path, "ab") as f:
-                f.write(self._log_buf.to_bytes())
-            self._log_buf.clear()
-            self._rotate_if_needed(self.log_path)
+            fh = self._get_fh(self.log_path, "_log_fh")
+            fh.write(self._log_buf)
+            written = len(self._log_buf)
+            if summary is not None:
+                fh.write(summary)
+                written += len(summary)
+            fh.flush()
+            self._log_bytes += written
+            self._log_buf[:] = b""
+            # only counted as reported once the summary actually reached the file
+            self._dropped -= dropped
+            if 0 < self.max_bytes < self._log_bytes:
+                self._log_rotate_pending = True
         except OSError as e:
             print(f"Error writing to file: {e}")
 
     def _flush_data(self):
         """Write buffered data lines to disk and rotate if needed."""
-        if not _file_exists(self.data_path):
-            create_file(self.data_path)
-
-        if self._data_buf.is_empty():
+        if not self._data_buf:
             return
 
         try:
-            with open(self.data_path, "a", encoding="utf-8") as f:
-                for i in self._data_buf:
-                    f.write(i)
-
-            self._data_buf.clear()
-            self._rotate_if_needed(self.data_path)
+            fh = self._get_fh(self.data_path, "_data_fh")
+            fh.write(self._data_buf)
+            fh.flush()
+
+            self._data_bytes += len(self._data_buf)
+            self._data_buf[:] = b""
+            if 0 < self.max_bytes < self._data_bytes:
+                self._data_rotate_pending = True
         except OSError as e:
             print("[LOGGER] flush_data OSError:", e)
 
-    def flush(self):
-        """Flush both buffers"""
+    def flush(self, force_rotate: bool = False):
+        """
+        Flush both buffers
+        :param force_rotate: Also run the rotations the flush flagged, instead of leaving them to rotate_pending()
+        """
         self._flush_logs()
         self._flush_data()
-
-    def _rotate_if_needed(self, path):
+        if force_rotate:
+            self.rotate_pending()
+
+    def rotate_pending(self) -> None:
+        """
+        Rotate the files whose flush crossed max_bytes.
+        Flushes only flag the rotation, so the renames run here (Root's log_rotate_task)
+        instead of inside whichever log call triggered the flush.
+        """
+        if self._log_rotate_pending:
+            self._log_rotate_pending = False
+            if self._rotate_if_needed(self.log_path, "_log_fh", self._log_bytes):
+                self._log_bytes = 0
+        if self._data_rotate_pending:
+            self._data_rotate_pending = False
+            if self._rotate_if_needed(self.data_path, "_data_fh", self._data_bytes):
+                self._data_bytes = 0
+
+    def close(self) -> None:
+        """Flush both buffers, run pending rotations and close the open file handles."""
         try:
-            stat = os.stat(path)
-            size = stat[6]  # file size
-        except OSError:
-            size = 0  # file doesn't exist
+            self.flush(force_rotate=True)
+        finally:
+            self._close_fh("_log_fh")
+            self._close_fh("_data_fh")
 
+    def _rotate_if_needed(self, path, fh_attr, size) -> bool:
+        """
+        Rotate path if size (the caller's byte count for it) exceeds max_bytes.
+        :return: True if the file was rotated
+        """
         if self.max_bytes <= 0:
-            return
+            return False
 
         if size > self.max_bytes:
-            # rotate: path -> path.0, path.0 -> path.1 ... up to max_rotations-1
+            # the handle points at the file being renamed; the next flush reopens a fresh one
+            self._close_fh(fh_attr)
+            # rotate: path -> path.1, path.1 -> path.2 ... up to max_rotations-1
+            # every step is just attempted; a missing file raises OSError, which saves
+            # an existence probe (a directory listing) per step
             try:
                 # remove the oldest if needed
-                last = f"{path}.{self.max_rotations - 1}"
-                if _file_exists(last):
-                    os.remove(last)
-                for i in range(self.max_rotations - 2, -1, -1):
-                    src = f"{path}.{i}" if i > 0 else path
-                    dst = f"{path}.{i + 1}"
-                    if _file_exists(src):
-                        os.rename(src, dst)
+                os.remove(f"{path}.{self.max_rotations - 1}")
+            except OSError:
+                pass
+            for i in range(self.max_rotations - 2, 0, -1):
+                try:
+                    os.rename(f"{path}.{i}", f"{path}.{i + 1}")
+                except OSError:
+                    pass
+            try:
+                if self.max_rotations > 1:
+                    os.rename(path, f"{path}.1")
             except OSError as e:
                 print("[LOGGER] _rotate_if_needed Exception", e)
+                return False
+            return True
+        return False
 
     def _should_log(self, level_int: int):
+        # the level methods below inline this check to save a call per log
         return level_int <= self.level
 
     def trace(self, msg="") -> None:
@@ -255,7 +368,7 @@ class Logger:
         :param msg:
         :return:
         """
-        if self._should_log(TRACE):
+        if TRACE <= self.level:
             self._enqueue_log(TRACE, msg)
 
     def debug(self, msg="") -> None:
@@ -264,7 +377,7 @@ class Logger:
         :param msg:
         :return:
         """
-        if self._should_log(DEBUG):
+        if DEBUG <= self.level:
             self._enqueue_log(DEBUG, msg)
 
     def info(self, msg="") -> None:
@@ -273,7 +386,7 @@ class Logger:
         :param msg:
         :return:
         """
-        if self._should_log(INFO):
+        if INFO <= self.level:
             self._enqueue_log(INFO, msg)
 
     def warn(self, msg="") -> None:
@@ -282,7 +395,7 @@ class Logger:
         :param msg:
         :return:
         """
-        if self._should_log(WARN):
+        if WARN <= self.level:
             self._enqueue_log(WARN, msg)
             self._flush_logs()
 
@@ -292,7 +405,7 @@ class Logger:
         :param msg:
         :return:
         """
-        if self._should_log(ERROR):
+        if ERROR <= self.level:
             self._enqueue_log(ERROR, msg)
             self._flush_logs()
 
@@ -302,7 +415,7 @@ class Logger:
         :param msg:
         :return:
         """
-        if self._should_log(FATAL):
+        if FATAL <= self.level:
             self._enqueue_log(FATAL, msg)
             self._flush_logs()
 
@@ -330,12 +443,13 @@ class Logger:
     def get_status(self) -> dict:
         """
         Return the current status of the logger.
-        :return: dict with current status (level, queue_len, data_queue_len, file_log, console)
+        :return: dict with current status (level, queue_len, data_queue_len, dropped, file_log, console)
         """
         return {
             "level": self.level,
             "queue_len": len(self._log_buf),
             "data_queue_len": len(self._data_buf),
+            "dropped": self._dropped,
             "file_log": self.file_log,
             "console": self.console,
         }
@@ -351,6 +465,7 @@ def init_logger(
     console=True,
     file_log=True,
     max_rotations=3,
+    console_buffered=False,
 ) -> Logger:
     """
     Initialize the global logger singleton.
@@ -360,6 +475,7 @@ def init_logger(
     :param console: Weather logs should be printed to console
     :param file_log: Weather logs should be written to file
     :param max_rotations: The maximum number of log- / datafiles before the oldest is deleted
+    :param console_buffered: Collect console lines and print them in one write per flush_console()
     :return:
     """
     global _logger_instance  # pylint: disable=global-statement
@@ -372,6 +488,7 @@ def init_logger(
             console=cfg.get(LOGGER_CONSOLE) or console,
             file_log=cfg.get(LOGGER_FILE_LOG) or file_log,
             max_rotations=cfg.get(LOGGER_MAX_ROTATIONS) or max_rotations,
+            console_buffered=cfg.get(LOGGER_CONSOLE_BUFFERED) or console_buffered,
         )
     return _logger_instance
 
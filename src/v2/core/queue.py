@@ -1,11 +1,11 @@
 """
 PicoCore V2 Queue Module
 
-This module provides a RingBuffer and ByteRingBuffer class
-for a ring buffer of arbitrary Python objects and bytes.
+This module provides a RingBuffer, ByteRingBuffer and FloatRing class
+for a ring buffer of arbitrary Python objects, bytes and floats.
 
 Usage:
-    from core.queue import RingBuffer, ByteRingBuffer
+    from core.queue import RingBuffer, ByteRingBuffer, FloatRing
 
     rb = RingBuffer(10)
     rb.put(1)
@@ -25,12 +25,9 @@ Usage:
 # - Ensure _enable_irq() is never called with undefined state
 #
 # TODO: Optimize hot paths for MicroPython:
-# - Inline _inc() in put()/get() to remove function call overhead
-# - Cache local variables (_buf, _head, _tail) inside tight loops to reduce attribute lookups
 # - Prefer bitmask wrapping when capacity is power-of-two (already partially implemented)
 #
 # TODO: Fix inefficient methods:
-# - to_tuple() is O(n²) due to repeated tuple concatenation → replace with tuple(self.to_list())
 # - to_bytes() currently consumes buffer and allocates inefficiently → rewrite to be non-destructive and single-pass
 # - ByteRingBuffer.put() iterates byte-by-byte → optimize for bytes input if possible
 #
@@ -45,6 +42,7 @@ Usage:
 # - Consider specialized numeric buffer (e.g., array('f')) for DSP/sensor workloads
 
 import machine
+from array import array
 
 
 def _disable_irq() -> object:
@@ -95,15 +93,20 @@ class RingBuffer:
         """
         irq_state = _disable_irq()
         try:
-            if self._count == self._cap:
-                if not self._overwrite:
-                    raise IndexError("RingBuffer full")
-                # overwrite oldest: advance tail (drop one)
-                self._tail = self._inc(self._tail)
-                self._count -= 1
-            self._buf[self._head] = item
-            self._head = self._inc(self._head)
-            self._count += 1
+            full = self._count == self._cap
+            if full and not self._overwrite:
+                raise IndexError("RingBuffer full")
+            head = self._head
+            self._buf[head] = item
+            head += 1
+            if head == self._cap:
+                head = 0
+            self._head = head
+            if full:
+                # overwrote the oldest item: tail follows head
+                self._tail = head
+            else:
+                self._count += 1
         finally:
             _enable_irq(irq_state)
 
@@ -135,10 +138,15 @@ class RingBuffer:
         try:
             if self._count == 0:
                 raise IndexError("RingBuffer empty")
-            item = self._buf[self._tail]
+            buf = self._buf
+            tail = self._tail
+            item = buf[tail]
             # help GC on memory-constrained ports
-            self._buf[self._tail] = None
-            self._tail = self._inc(self._tail)
+            buf[tail] = None
+            tail += 1
+            if tail == self._cap:
+                tail = 0
+            self._tail = tail
             self._count -= 1
             return item
         finally:
@@ -237,31 +245,23 @@ class RingBuffer:
 
     def to_list(self) -> list[object]:
         """Return elements in order as a list (allocates)."""
-        out: list[object] = []
-        idx = self._tail
-        for _ in range(self._count):
-            out.append(self._buf[idx])
-            idx = self._inc(idx)
-        return out
+        # at most two slices of the backing list; the copy runs in C, not per item
+        tail = self._tail
+        end = tail + self._count
+        if end <= self._cap:
+            return self._buf[tail:end]
+        return self._buf[tail:] + self._buf[: end - self._cap]
 
     def to_tuple(self) -> tuple[object]:
         """
         Return elements in order as a tuple (allocates).
         :return:
         """
-        out: tuple = ()
-        idx = self._tail
-        for _ in range(self._count):
-            out += (self._buf[idx],)
-            idx = self._inc(idx)
-        return out
+        return tuple(self.to_list())
 
     def __iter__(self):  # type: ignore
-        """Return iterator over elements in order."""
-        idx = self._tail
-        for _ in range(self._count):
-            yield self._buf[idx]
-            idx = self._inc(idx)
+        """Return iterator over a snapshot of the elements in order."""
+        return iter(self.to_list())
 
     def __len__(self) -> int:
         return self._count
@@ -411,3 +411,59 @@ class ByteRingBuffer:
 
     def __repr__(self) -> str:
         return f"<ByteRingBuffer cap={self._cap} bytes={self._count}>"
+
+
+class FloatRing:
+    """
+    Fixed-size ring buffer of floats on a preallocated array('f').
+    - capacity: number of floats kept; put() overwrites the oldest once full
+    Nothing is allocated per put(). Every value is stored twice, at i and
+    i + capacity, so view() is always one contiguous slice in chronological order.
+    Methods: put, peek_latest, view, clear
+    """
+
+    __slots__ = ("_buf", "_mv", "_head", "_full", "_cap")
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be > 0")
+        self._cap = int(capacity)
+        self._buf = array("f", [0.0] * (2 * self._cap))
+        self._mv = memoryview(self._buf)
+        self._head = 0  # index for next write
+        self._full = False
+
+    def put(self, value: float) -> None:
+        """Store value, dropping the oldest one if the buffer is full."""
+        head = self._head
+        self._buf[head] = value
+        self._buf[head + self._cap] = value
+        head += 1
+        if head == self._cap:
+            head = 0
+            self._full = True
+        self._head = head
+
+    def peek_latest(self) -> float:
+        """Return the newest value without removing it."""
+        if not self._full and self._head == 0:
+            raise IndexError("peek from empty buffer")
+        # head - 1 is -1 right after a wrap, which is the last slot of the mirror half
+        return self._buf[self._head - 1]
+
+    def view(self) -> memoryview:
+        """Return a memoryview over the stored values, oldest first (no copy; valid until the next put)."""
+        if self._full:
+            return self._mv[self._head : self._head + self._cap]
+        return self._mv[: self._head]
+
+    def clear(self) -> None:
+        """Forget all values (the storage is kept)."""
+        self._head = 0
+        self._full = False
+
+    def __len__(self) -> int:
+        return self._cap if self._full else self._head
+
+    def __repr__(self) -> str:
+        return f"<FloatRing cap={self._cap} items={len(self)}>"
@@ -78,7 +78,9 @@ class Task:
         :param callback: Function or coroutine to execute
         :param interval: Execution interval (int ms or str like "1ms", "1s", "5min", "1h"), ignored for boot tasks
         :type interval: str | int | None
-        :param async_task: Whether the callback is async (coroutine)
+        :param async_task: Whether the callback is async (coroutine).
+                           Never auto-detected: the scheduler awaits or calls the
+                           callback based on this flag alone, without probing its result.
         :param enabled: Whether the task is active
         :param priority: Task priority (lower = higher priority)
         :param boot: If True, runs only during boot phase
@@ -217,7 +219,7 @@ class Root:
     def __init__(self):
         self.conf = get_config()
         self.running = False
-        # Interval for async sleep in main loop
+        # Interval for async sleep in main loop (s); read once here, sleep() only uses the attribute
         self.sleep_interval = self.conf.get(SLEEP_INTERVAL) or 0.1
         self.power_monitor = self.conf.get(POWER_MONITOR_ENABLED) or False
         self.mesh = (
@@ -256,6 +258,32 @@ class Root:
             )
         )
 
+        # buffered console output is printed in one write per tick instead of per log call
+        if logger().console_buffered:
+            self.add(
+                Task(
+                    "log_console_task",
+                    logger().flush_console,
+                    interval=500,
+                    async_task=False,
+                    priority=0,
+                    enabled=True,
+                )
+            )
+
+        # file rotation is flagged by the flushes and done here, off the log call path
+        if logger().file_log:
+            self.add(
+                Task(
+                    "log_rotate_task",
+                    logger().rotate_pending,
+                    interval=1000,
+                    async_task=False,
+                    priority=0,
+                    enabled=True,
+                )
+            )
+
         if self.mesh:
             self._mesh = mesh()
 
@@ -285,6 +313,16 @@ class Root:
 
         self.optimize()
 
+    def set_tick_hz(self, hz: float) -> None:
+        """
+        Change the main loop's tick rate at runtime (the cooperative sleep between passes).
+        :param hz: Loop passes per second, must be > 0
+        :return:
+        """
+        if hz <= 0:
+            raise ValueError("hz must be > 0")
+        self.sleep_interval = 1.0 / hz
+
     def add(self, _task: Task):
         """
         Add a task to the root scheduler.
@@ -445,8 +483,12 @@ class Root:
                 pending_tasks_.clear()
                 optimize_()
 
+            # read once per tick (only optimize() above changes it), not once per task
+            dynamic_sleep = self.dynamic_sleep
+
             for _task in tasks:
-                if _task.should_run(now) and not _task.running:
+                # the cheap slot read first: a still-running parallel task skips the should_run() call
+                if not _task.running and _task.should_run(now):
                     if _task.parallel:
                         _task.running = True
 
@@ -459,7 +501,7 @@ class Root:
                     else:
                         _task.run(now)
 
-                if self.dynamic_sleep:
+                if dynamic_sleep:
                     t = ticks_diff_(_task.next_run, now)
                     t = max(t, 0)
                     self._time_proposal_buffer.put(t)  # buffer_put(t)
@@ -44,11 +44,12 @@ class _Sub:
     per-instance __dict__ overhead on MicroPython.
     """
 
-    __slots__ = ("id", "parts", "cb", "buf", "is_async")
+    __slots__ = ("id", "parts", "multi", "cb", "buf", "is_async")
 
-    def __init__(self, sub_id: int, parts, cb, buf, is_async: bool) -> None:
+    def __init__(self, sub_id: int, parts, cb, buf, is_async: bool, multi: int = -1) -> None:
         self.id = sub_id  # unique int identifier
         self.parts = parts  # pre-split tuple for wildcards, None for exact
+        self.multi = multi  # index of # in parts (wildcards only), -1 if there is none
         self.cb = cb  # callable or None
         self.buf = buf  # RingBuffer or None
         self.is_async = is_async  # True  → cb is  async def, must be await-ed
@@ -100,22 +101,28 @@ class PubSub:
         return "+" in pattern or "#" in pattern
 
     @staticmethod
-    def _match(pat_parts: tuple, topic_parts: tuple) -> bool:
+    def _match(pat_parts: tuple, topic_parts: tuple, multi: int = -1) -> bool:
         """
         MQTT-style matching.  Both arguments are pre-split tuples — no allocation
-        happens here during a publish call.
+        happens here during a publish call.  multi is the precomputed index of #
+        in pat_parts (-1 if absent), so the level count is checked before any
+        level is compared.
         """
-        lp = len(pat_parts)
         lt = len(topic_parts)
-        for i in range(lp):
-            p = pat_parts[i]
-            if p == "#":
-                return True  # # matches anything that follows, including nothing
-            if i >= lt:
+        if multi < 0:
+            n = len(pat_parts)
+            if n != lt:
+                return False
+        else:
+            # # matches anything that follows, including nothing
+            n = multi
+            if lt < n:
                 return False
+        for i in range(n):
+            p = pat_parts[i]
             if p != "+" and p != topic_parts[i]:
                 return False
-        return lp == lt
+        return True
 
     # ------------------------------------------------------------------
     # Subscription management
@@ -148,7 +155,8 @@ class PubSub:
             sid = self._next_id()
             if self._has_wildcard(pattern):
                 parts = tuple(pattern.split("/"))  # split once, stored for lifetime
-                sub = _Sub(sid, parts, cb, buf, is_async)
+                multi = parts.index("#") if "#" in parts else -1
+                sub = _Sub(sid, parts, cb, buf, is_async, multi)
                 self._wildcard.append(sub)
             else:
                 sub = _Sub(sid, None, cb, buf, is_async)
@@ -165,7 +173,12 @@ class PubSub:
     def unsubscribe(self, _id=None, topic: str = None, cb=None) -> None:
         """
         Remove subscriptions matching ANY of the supplied criteria.
-        Uses reverse-index in-place pop — no full-list rebuild.
+        Uses reverse-index in-place pop — no full list rebuild.
+
+        A topic narrows the removal to subscriptions on that exact pattern
+        string, and only the container holding that pattern is touched
+        (its exact bucket, or the wildcard list).  A topic on its own removes
+        every subscription on it.
 
         :param _id:   Remove the subscription with this ID.
         :param topic: Remove subscriptions on this exact pattern string.
@@ -174,33 +187,40 @@ class PubSub:
         if _id is None and topic is None and cb is None:
             return  # nothing to do
 
+        take_all = _id is None and cb is None  # topic-only removal
+        wild_topic = topic is not None and self._has_wildcard(topic)
+
         irq = _dis()
         try:
             # --- exact bucket(s) ---
-            if topic is not None and not self._has_wildcard(topic):
-                # fast path: only touch the one relevant bucket
-                bucket = self._exact.get(topic)
-                if bucket is not None:
-                    self._prune(bucket, _id, cb)
-                    if not bucket:
-                        del self._exact[topic]
-            else:
-                # must scan every bucket (id- or cb-only removal, or wildcard topic filter)
+            if topic is None:
+                # id- or cb-only removal: must scan every bucket
                 for key in list(self._exact.keys()):
                     bucket = self._exact[key]
                     self._prune(bucket, _id, cb)
                     if not bucket:
                         del self._exact[key]
+            elif not wild_topic:
+                # fast path: only touch the one relevant bucket
+                bucket = self._exact.get(topic)
+                if bucket is not None:
+                    if not take_all:
+                        self._prune(bucket, _id, cb)
+                    if take_all or not bucket:
+                        del self._exact[topic]
 
             # --- wildcard list ---
-            i = len(self._wildcard) - 1
-            while i >= 0:
-                s = self._wildcard[i]
-                if self._matches_filter(s, _id, cb):  # noqa: SIM102
-                    # if a topic filter was supplied, also check the pattern string
-                    if topic is None or "/".join(s.parts) == topic:
+            if topic is None or wild_topic:
+                # compared against the stored tuples; split once, not joined per sub
+                parts = tuple(topic.split("/")) if wild_topic else None
+                i = len(self._wildcard) - 1
+                while i >= 0:
+                    s = self._wildcard[i]
+                    if (parts is None or s.parts == parts) and (
+                        take_all or self._matches_filter(s, _id, cb)
+                    ):
                         self._wildcard.pop(i)
-                i -= 1
+                    i -= 1
         finally:
             _en(irq)
 
@@ -266,6 +286,28 @@ class PubSub:
             else:
                 self._call_sync(sub, topic, msg)
 
+    def _dispatch(self, subs: list, topic: str, msg) -> None:
+        """
+        Deliver one message to every subscriber in subs (sync path).
+
+        Same as _deliver() per sub, but inlined into one loop so an exact-topic
+        publish costs one method call instead of one or two per subscriber.
+        """
+        for sub in subs:
+            if sub.buf is not None:
+                sub.buf.put((topic, msg))
+            cb = sub.cb
+            if cb is None:
+                continue
+            if sub.is_async:
+                create_task(cb(topic, msg))
+                continue
+            try:
+                cb(topic, msg)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                if self._err_cb:
+                    self._err_cb(sub.id, topic, exc)
+
     # ------------------------------------------------------------------
     # Publish
     # ------------------------------------------------------------------
@@ -280,21 +322,17 @@ class PubSub:
                            Do NOT use async subscribers for pre-loop events.
         - Buffer subs:     message appended to RingBuffer immediately.
         """
-        topic_parts = None  # lazy — only split if wildcard subs exist
-
         # O(1) exact-match lookup
         bucket = self._exact.get(topic)
         if bucket:
-            for sub in bucket:
-                coro = self._deliver(sub, topic, msg)
-                if coro is not None:
-                    create_task(coro)
+            self._dispatch(bucket, topic, msg)
 
-        # wildcard scan (typically very short)
+        # wildcard scan (typically very short); skipped without wildcard subs,
+        # so exact-only traffic never splits the topic
         if self._wildcard:
             topic_parts = tuple(topic.split("/"))
             for sub in self._wildcard:
-                if self._match(sub.parts, topic_parts):
+                if self._match(sub.parts, topic_parts, sub.multi):
                     coro = self._deliver(sub, topic, msg)
                     if coro is not None:
                         create_task(coro)
@@ -317,7 +355,7 @@ class PubSub:
         if self._wildcard:
             topic_parts = tuple(topic.split("/"))
             for sub in self._wildcard:
-                if self._match(sub.parts, topic_parts):
+                if self._match(sub.parts, topic_parts, sub.multi):
                     await self._deliver_async(sub, topic, msg)
 
 
@@ -3,81 +3,157 @@ from ..constants import POWER_ADC_PIN, POWER_VOLTAGE_DIVIDER_R1, POWER_VOLTAGE_D
     NORMALIZED_VOLTAGE_DIFFERENCE_V_MAX_TO_V_NOMINAL, NORMALIZED_VOLTAGE_MARGIN_V_CUT_OFF_TO_V_NOMINAL
 from ..io import VoltageDivider
 from ..config import get_config
-from ..queue import RingBuffer
+from ..queue import FloatRing
+
+try:
+    # ulab ships with many MicroPython builds; numpy covers running on CPython
+    from ulab import numpy as np
+except ImportError:
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+
+_NAN = float("nan")
+# upper bound of the nominal range in normalized voltage
+_VMT = 1 - NORMALIZED_VOLTAGE_DIFFERENCE_V_MAX_TO_V_NOMINAL
+
+_power_instance = None
 
 
 class Power(VoltageDivider):
+    def __new__(cls):
+        # one pooled instance: a re-init (e.g. around safe mode) reuses its buffers
+        # instead of leaving the old storage to the GC and allocating new storage
+        global _power_instance  # pylint: disable=global-statement
+        if _power_instance is None:
+            _power_instance = super().__new__(cls)
+        return _power_instance
+
     def __init__(self):
         conf = get_config()
+        # VoltageDivider.__init__ resets the ADC burst buffer; the pooled instance keeps it
+        sample_buf = getattr(self, "_sample_buf", None)
         super().__init__(
             conf.get(POWER_ADC_PIN),
             conf.get(POWER_VOLTAGE_DIVIDER_R1),
             conf.get(POWER_VOLTAGE_DIVIDER_R2)
         )
+        self._sample_buf = sample_buf
 
         self._sleep_interval = conf.get(SLEEP_INTERVAL)
         self._cut_off_voltage = conf.get(POWER_BATTERY_VOLTAGE_CUT_OFF)
         self._nominal_voltage = conf.get(POWER_BATTERY_VOLTAGE_NOMINAL)
         self._max_voltage = conf.get(POWER_BATTERY_VOLTAGE_MAX)
-        self._voltage_buffer: RingBuffer | None = None
-        self._time_left_buffer: RingBuffer | None = None
+        # constant for the lifetime of Power: multiply per sample instead of dividing
+        # (float division is software-emulated on the Cortex-M0+)
+        self._inv_voltage_span = 1.0 / (self._max_voltage - self._cut_off_voltage)
+        self._inv_dt_s = 1000.0 / self._sleep_interval  # 1 / tick interval in s
+        # _voltage_buffer / _time_left_buffer are created by the first init() and kept after
+        # newest voltage sample, kept by tick() so the helpers don't peek the buffer
+        self._current_voltage: float | None = None
+        self._data: dict | None = None
+        # incremental trend: EWMAs of dV/dt and d²V/dt², updated in O(1) per tick
+        self._alpha = 0.3
+        self._ewma_slope: float | None = None
+        self._ewma_accel: float | None = None
+        self._prev_v: float | None = None
+        self._prev_slope: float | None = None
 
         self.init()
 
     @property
     def data(self):
-        return {
-            "voltage": self._voltage_buffer,
-            "time_left": self._time_left_buffer
-        }
+        """
+        The sample buffers by name. Built once in init(), so reading it allocates nothing;
+        the dict is shared, don't modify it.
+        """
+        return self._data
 
 
     def init(self):
-        self._voltage_buffer = RingBuffer(10, overwrite=True)
-        self._time_left_buffer = RingBuffer(10, overwrite=True)
+        if getattr(self, "_voltage_buffer", None) is None:
+            # floats in preallocated arrays, so a tick adds no heap allocation here;
+            # a time left of None ("no estimate") is stored as NaN
+            self._voltage_buffer = FloatRing(10)
+            self._time_left_buffer = FloatRing(10)
+        else:
+            self._voltage_buffer.clear()
+            self._time_left_buffer.clear()
+        self._current_voltage = None
+        self._ewma_slope = None
+        self._ewma_accel = None
+        self._prev_v = None
+        self._prev_slope = None
+        self._data = {
+            "voltage": self._voltage_buffer,
+            "time_left": self._time_left_buffer
+        }
 
     async def check(self):
         return await self.async_check()
 
     def deinit(self):
-        del self._voltage_buffer
+        # contents only; the storage is kept for the next init()
+        self._voltage_buffer.clear()
+        self._time_left_buffer.clear()
 
     async def tick(self):
         """Tick function to be called at regular intervals."""
         print("Power tick")
         # Add the mean of the last 10 samples to the buffer per tick
-        self._voltage_buffer.put(await self.async_mean_real_voltage(delay=0.5))
-        self._time_left_buffer.put(self.estimate_time_left())
-        print(self._voltage_buffer.peek_latest(), self._time_left_buffer.peek_latest())
+        voltage = await self.async_mean_real_voltage(delay=0.5)
+        self._voltage_buffer.put(voltage)
+        self._current_voltage = voltage
+        self._update_trend(voltage)
+        time_left = self.estimate_time_left()
+        self._time_left_buffer.put(_NAN if time_left is None else time_left)
+        print(voltage, self._time_left_buffer.peek_latest())
 
         self.eval()
 
     def eval(self):
         pass
 
+    def _update_trend(self, voltage: float):
+        """
+        Fold a new sample into the slope / acceleration EWMAs (the first value of each seeds it).
+        :param voltage:
+        :return:
+        """
+        prev_v = self._prev_v
+        self._prev_v = voltage
+        if prev_v is None:
+            return
+        alpha = self._alpha
+        slope = (voltage - prev_v) * self._inv_dt_s
+        ewma = self._ewma_slope
+        self._ewma_slope = slope if ewma is None else alpha * slope + (1 - alpha) * ewma
+
+        prev_slope = self._prev_slope
+        self._prev_slope = slope
+        if prev_slope is None:
+            return
+        accel = (slope - prev_slope) * self._inv_dt_s
+        ewma = self._ewma_accel
+        self._ewma_accel = accel if ewma is None else alpha * accel + (1 - alpha) * ewma
+
     def estimate_time_left(self):
         """Estimate time remaining until cutoff voltage.Time is in seconds."""
-        current_voltage = self._voltage_buffer.peek_latest()
-
-        if self.is_in_nominal_range(current_voltage):
+        if self.is_in_nominal_range(self._current_voltage):
             return None
 
-        slopes, accel = self.slope_trend(self._voltage_buffer.to_list())
-
-        if not slopes:
+        # the acceleration needs three samples, as slope_trend() over the buffer did
+        if self._ewma_accel is None:
             return None  # not enough data
 
-        current_slope = slopes[-1]  # latest dV/dt
-
         voltage_diff = self.calc_difference_to_cut_off()
-        # estimate time (s)
-        time_left = voltage_diff / current_slope
+        # estimate time (s) from the smoothed dV/dt
+        time_left = voltage_diff / self._ewma_slope
 
-        # optional: refine using acceleration
-        if len(accel) > 0:
-            avg_accel = accel[-1]
-            # rough correction if acceleration significant
-            time_left *= avg_accel
+        # rough correction if acceleration significant
+        time_left *= self._ewma_accel
 
         return time_left
 
@@ -88,7 +164,7 @@ class Power(VoltageDivider):
         A negative value means the battery is below cutoff voltage.
         :return:
         """
-        return self._cut_off_voltage - self._voltage_buffer.peek_latest()
+        return self._cut_off_voltage - self._current_voltage
 
     def calc_difference_to_nominal(self):
         """
@@ -97,7 +173,7 @@ class Power(VoltageDivider):
         A negative value means the battery is below nominal voltage.
         :return:
         """
-        return self._nominal_voltage - self._voltage_buffer.peek_latest()
+        return self._nominal_voltage - self._current_voltage
 
     def calc_difference_to_max(self):
         """
@@ -106,19 +182,14 @@ class Power(VoltageDivider):
         A negative value means the battery is below max voltage.
         :return:
         """
-        return self._max_voltage - self._voltage_buffer.peek_latest()
+        return self._max_voltage - self._current_voltage
 
     def is_in_nominal_range(self, voltage: float | int):
         """
         Check if the current voltage is within the nominal range.
         :return:
         """
-        vn = self.normalize_voltage(voltage)
-        vmt = 1 - NORMALIZED_VOLTAGE_DIFFERENCE_V_MAX_TO_V_NOMINAL
-
-        if vmt > vn > NORMALIZED_VOLTAGE_MARGIN_V_CUT_OFF_TO_V_NOMINAL:
-            return True
-        return False
+        return _VMT > self.normalize_voltage(voltage) > NORMALIZED_VOLTAGE_MARGIN_V_CUT_OFF_TO_V_NOMINAL
 
     def normalize_voltage(self, voltage: float | int):
         """
@@ -126,34 +197,33 @@ class Power(VoltageDivider):
         :param voltage:
         :return:
         """
-        return (voltage - self._cut_off_voltage) / (self._max_voltage - self._cut_off_voltage)
+        return (voltage - self._cut_off_voltage) * self._inv_voltage_span
 
     def slope_trend(self, values=None, dt=None):
         """
         Compute how the rate of change (slope) evolves over time.
         Returns:
-            slopes: list of slope estimates per interval (V/s)
-            accel:  list of acceleration estimates (change in slope) per interval (V/s²)
+            slopes: slope estimates per interval (V/s)
+            accel:  acceleration estimates (change in slope) per interval (V/s²)
+        Both are arrays when (ulab.)numpy is available, lists otherwise.
         """
         if values is None:
-            values = self._voltage_buffer.to_list()
-        if dt is None:
-            dt = self._sleep_interval / 1000
+            values = self._voltage_buffer.view()
         n = len(values)
         if n < 3:
             return [], []
 
-        # first derivative (V/s)
-        slopes = []
-        inv_dt = 1.0 / dt
-        for i in range(n - 1):
-            slopes.append((values[i + 1] - values[i]) * inv_dt)
+        inv_dt = self._inv_dt_s if dt is None else 1.0 / dt
+        if np is not None:
+            # both derivatives as whole-array differences, no per-element bytecode
+            v = np.array(values)
+            slopes = (v[1:] - v[:-1]) * inv_dt
+            return slopes, (slopes[1:] - slopes[:-1]) * inv_dt
 
+        # first derivative (V/s)
+        slopes = [(b - a) * inv_dt for a, b in zip(values, values[1:])]
         # second derivative (V/s²)
-        accel = []
-        for i in range(len(slopes) - 1):
-            accel.append((slopes[i + 1] - slopes[i]) * inv_dt)
-
+        accel = [(b - a) * inv_dt for a, b in zip(slopes, slopes[1:])]
         return slopes, accel
 
 
@@ -115,16 +115,14 @@ def uptime(ms: bool = False, formatted: bool = False) -> int | str:
         Hours, minutes, and seconds are zero-padded to two digits.
     """
 
-    # get uptime in ms
-    uptime_ms = time.ticks_diff(time.ticks_ms(), 0)
+    # get uptime in ms (ticks count up from 0 at boot, so no ticks_diff needed)
+    uptime_ms = time.ticks_ms()
 
     if formatted:
-        total_ms = uptime_ms
-        total_s, _ = divmod(total_ms, 1000)
-        m, s = divmod(total_s, 60)
-        h, m = divmod(m, 60)
-        d, h = divmod(h, 24)
-        return f"{d}d {h:02}:{m:02}:{s:02}"
+        s = uptime_ms // 1000
+        m = s // 60
+        h = m // 60
+        return "%dd %02d:%02d:%02d" % (h // 24, h % 24, m % 60, s % 60)
 
     if ms:
         return uptime_ms
@@ -133,6 +131,9 @@ def uptime(ms: bool = False, formatted: bool = False) -> int | str:
     return round(uptime_ms / 1000)
 
 
+_UNIQUE_ID_CACHE = None
+
+
 def uuid(byte: bool = False) -> bytes | str:
     """
     Get the unique identifier of the microcontroller.
@@ -153,10 +154,13 @@ def uuid(byte: bool = False) -> bytes | str:
         >>> uuid()  # Returns hex string like 'e6614c311b2c5c28'
         >>> uuid(byte=True)  # Returns raw bytes
     """
-    if byte:
-        return machine.unique_id()
+    global _UNIQUE_ID_CACHE
+    if _UNIQUE_ID_CACHE is None:
+        # hardware constant: read once, keep both representations
+        uid = machine.unique_id()
+        _UNIQUE_ID_CACHE = (uid, uid.hex())
 
-    return machine.unique_id().hex()
+    return _UNIQUE_ID_CACHE[0] if byte else _UNIQUE_ID_CACHE[1]
 
 
 def version() -> list[str] | None: